@@ -21,6 +21,7 @@ from pathlib import Path
 from typing import Final, Optional
 
 import pandapower as pp
+import pandas as pd
 from pandapower import LoadflowNotConverged
 
 import gridcapacity.backends.pandapower as pp_backend
@@ -32,6 +33,12 @@ LOG_LEVEL: Final[int] = (
 )
 
 
+# optional `lightsim2grid` supports the Newton-Raphson solver only
+NEWTON_RAPHSON_SOLVER_OPTS: Final[dict] = (
+    {"numba": True, "lightsim2grid": True} if envs.lightsim2grid else {"numba": True}
+)
+
+
 def is_converged() -> bool:
     return pp_backend.net.converged
 
@@ -61,17 +68,42 @@ def open_case(case_name: str) -> None:
     log.info(pp_backend.net)
 
 
+BusVoltages = pd.DataFrame
+
+
+def get_bus_voltages() -> BusVoltages:
+    """Return a copy of the present solution bus results"""
+    return pp_backend.net.res_bus.copy()
+
+
+def set_bus_voltages(bus_voltages: BusVoltages) -> None:
+    """Set the bus results the next warm started solution starts from"""
+    pp_backend.net.res_bus = bus_voltages.copy()
+
+
 def run_solver(
     use_full_newton_raphson: bool,
     solver_opts: Optional[dict] = None,
+    warm_start: bool = False,
 ) -> None:
-    """Default solver options are empty."""
+    """Default solver options are empty.
+
+    With `warm_start` the solution starts from the results of the previous one,
+    unless the solver options choose another initialization.
+    The Newton-Raphson solutions use the numba JIT compiled solver,
+    or the `lightsim2grid` one if enabled by the environment variable.
+    """
     effective_solver_opts = solver_opts or {}
+    if warm_start:
+        effective_solver_opts = {"init": "results", **effective_solver_opts}
     try:
         if not use_full_newton_raphson:
             pp.runpp(pp_backend.net, algorithm="fdbx", **effective_solver_opts)
         else:
-            pp.runpp(pp_backend.net, **effective_solver_opts)
+            pp.runpp(
+                pp_backend.net,
+                **{**NEWTON_RAPHSON_SOLVER_OPTS, **effective_solver_opts},
+            )
     except LoadflowNotConverged as e:
         log.log(LOG_LEVEL, e.args)
     if log.isEnabledFor(LOG_LEVEL):
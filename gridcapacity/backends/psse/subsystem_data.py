@@ -15,11 +15,16 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import functools
 import logging
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
 from typing import Final, Optional, Union
 
+import numpy as np
+
 from ...envs import envs
+from ..subsystems.utils import get_indexes_above, get_indexes_below
 from . import wrapped_funcs as wf
 
 log = logging.getLogger(__name__)
@@ -32,110 +37,147 @@ field_type2func_suffix: Final[dict[str, str]] = {
     "X": "cplx",
     "C": "char",
 }
+field_type2dtype: Final[dict[str, type]] = {
+    "I": np.int32,
+    "R": np.float64,
+    "X": np.complex128,
+    "C": object,
+}
 FieldType = Union[int, float, complex, str]
 
 SWING_BUS: Final[int] = 3
 
 
+@functools.cache
+def get_field_type(api_prefix: str, field_name: str) -> str:
+    """Return the field type code, e.g. "R" for `pctRate1`
+
+    The field type is only requested once: it doesn't depend on the case.
+    """
+    return getattr(wf, f"{api_prefix}types")(string=field_name)[0]
+
+
+@functools.cache
+def get_api_func(api_prefix: str, field_name: str) -> Callable:
+    """Return the API function retrieving the field, e.g. `abrnreal` for `pctRate1`"""
+    field_type = get_field_type(api_prefix, field_name)
+    return getattr(wf, f"{api_prefix}{field_type2func_suffix[field_type]}")
+
+
+def get_field_array(api_prefix: str, field_name: str) -> np.ndarray:
+    """Return the field values in a NumPy array of the field type"""
+    return np.asarray(
+        get_api_func(api_prefix, field_name)(string=field_name)[0],
+        dtype=field_type2dtype[get_field_type(api_prefix, field_name)],
+    )
+
+
+def get_fields(
+    api_prefix: str, field_names: tuple[str, ...]
+) -> tuple[list[FieldType], ...]:
+    """Return the fields values, retrieved by one API call per field type"""
+    field_names_by_api_func: dict[Callable, list[str]] = defaultdict(list)
+    for field_name in field_names:
+        field_names_by_api_func[get_api_func(api_prefix, field_name)].append(field_name)
+    values_by_field_name: dict[str, list[FieldType]] = {}
+    for api_func, same_type_field_names in field_names_by_api_func.items():
+        values_by_field_name.update(
+            zip(same_type_field_names, api_func(string=same_type_field_names))
+        )
+    return tuple(values_by_field_name[field_name] for field_name in field_names)
+
+
 def get_branch_field(field_name: str) -> list[FieldType]:
-    field_type = wf.abrntypes(string=field_name)[0]
-    api_func: Callable = getattr(wf, f"abrn{field_type2func_suffix[field_type]}")
-    value = api_func(string=field_name)[0]
-    return value
+    return get_api_func("abrn", field_name)(string=field_name)[0]
 
 
 def get_bus_field(field_name: str) -> list[FieldType]:
-    field_type = wf.abustypes(string=field_name)[0]
-    api_func: Callable = getattr(wf, f"abus{field_type2func_suffix[field_type]}")
-    value = api_func(string=field_name)[0]
-    return value
+    return get_api_func("abus", field_name)(string=field_name)[0]
 
 
 def get_load_field(field_name: str) -> list[FieldType]:
-    field_type = wf.aloadtypes(string=field_name)[0]
-    api_func: Callable = getattr(wf, f"aload{field_type2func_suffix[field_type]}")
-    value = api_func(string=field_name)[0]
-    return value
+    return get_api_func("aload", field_name)(string=field_name)[0]
 
 
 def get_plant_bus_field(field_name: str) -> list[FieldType]:
-    field_type = wf.agenbustypes(string=field_name)[0]
-    api_func: Callable = getattr(wf, f"agenbus{field_type2func_suffix[field_type]}")
-    value = api_func(string=field_name)[0]
-    return value
+    return get_api_func("agenbus", field_name)(string=field_name)[0]
 
 
 def get_trafo_field(field_name: str) -> list[FieldType]:
-    field_type = wf.atrntypes(string=field_name)[0]
-    api_func: Callable = getattr(wf, f"atrn{field_type2func_suffix[field_type]}")
-    value = api_func(string=field_name)[0]
-    return value
+    return get_api_func("atrn", field_name)(string=field_name)[0]
 
 
 def get_trafo_3w_field(field_name: str) -> list[FieldType]:
-    field_type = wf.awndtypes(string=field_name)[0]
-    api_func: Callable = getattr(wf, f"awnd{field_type2func_suffix[field_type]}")
-    value = api_func(string=field_name)[0]
-    return value
+    return get_api_func("awnd", field_name)(string=field_name)[0]
 
 
 def get_overloaded_branches_ids(max_branch_loading_pct: float) -> tuple[int, ...]:
     """Check `Percent from bus current of rating set 1`"""
-    ids: tuple[int, ...] = tuple(
-        branch_id
-        for branch_id, pct_rate1 in enumerate(wf.abrnreal(string="pctRate1")[0])
-        if pct_rate1 > max_branch_loading_pct
+    return get_indexes_above(
+        get_field_array("abrn", "pctRate1"), max_branch_loading_pct
     )
-    return ids
 
 
 def get_overloaded_swing_buses_ids(max_swing_bus_power_p_mw: float) -> tuple[int, ...]:
-    ids: tuple[int, ...] = tuple(
-        bus_id
-        for bus_id, (bus_type, p_mw) in enumerate(
-            zip(wf.agenbusint(string="type")[0], wf.agenbusreal(string="p_mw")[0])
-        )
-        if bus_type == SWING_BUS and p_mw > max_swing_bus_power_p_mw
+    buses_types: np.ndarray = get_field_array("agenbus", "type")
+    powers_p_mw: np.ndarray = get_field_array("agenbus", "p_mw")
+    return tuple(
+        np.flatnonzero(
+            (buses_types == SWING_BUS) & (powers_p_mw > max_swing_bus_power_p_mw)
+        ).tolist()
     )
-    return ids
 
 
 def get_overloaded_trafos_3w_ids(max_trafo_3w_loading_pct: float) -> tuple[int, ...]:
     """Check `Percent from bus current of rating set 1`"""
-    ids: tuple[int, ...] = tuple(
-        trafo_3w_id
-        for trafo_3w_id, pct_rate1 in enumerate(wf.awndreal(string="pctRate1")[0])
-        if pct_rate1 > max_trafo_3w_loading_pct
+    return get_indexes_above(
+        get_field_array("awnd", "pctRate1"), max_trafo_3w_loading_pct
     )
-    return ids
 
 
 def get_overloaded_trafos_ids(max_trafo_loading_pct: float) -> tuple[int, ...]:
     """Check `Percent from bus current of rating set 1`"""
-    ids: tuple[int, ...] = tuple(
-        trafo_id
-        for trafo_id, pct_rate1 in enumerate(wf.atrnreal(string="pctRate1")[0])
-        if pct_rate1 > max_trafo_loading_pct
-    )
-    return ids
+    return get_indexes_above(get_field_array("atrn", "pctRate1"), max_trafo_loading_pct)
 
 
 def get_overvoltage_buses_ids(max_bus_voltage: float) -> tuple[int, ...]:
-    ids: tuple[int, ...] = tuple(
-        bus_id
-        for bus_id, pu_voltage in enumerate(wf.abusreal(string="pu")[0])
-        if pu_voltage > max_bus_voltage
-    )
-    return ids
+    return get_indexes_above(get_field_array("abus", "pu"), max_bus_voltage)
 
 
 def get_undervoltage_buses_ids(min_bus_voltage: float) -> tuple[int, ...]:
-    ids: tuple[int, ...] = tuple(
-        bus_id
-        for bus_id, pu_voltage in enumerate(wf.abusreal(string="pu")[0])
-        if pu_voltage < min_bus_voltage
+    return get_indexes_below(get_field_array("abus", "pu"), min_bus_voltage)
+
+
+def get_voltage_violations_buses_ids(
+    min_bus_voltage: float, max_bus_voltage: float
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Return the undervoltage and overvoltage buses ids from one `pu` retrieval"""
+    voltages: np.ndarray = get_field_array("abus", "pu")
+    return (
+        get_indexes_below(voltages, min_bus_voltage),
+        get_indexes_above(voltages, max_bus_voltage),
     )
-    return ids
+
+
+def _log_table(
+    fields: tuple[str, ...],
+    values: Sequence[Sequence[FieldType]],
+    selected_ids: Optional[Iterable[int]],
+) -> None:
+    """Log the fields values rows between the fields names, as one record
+
+    Only the selected rows are logged, each once and in order,
+    or all of them if `selected_ids` is `None`.
+    """
+    rows: Iterable[tuple[FieldType, ...]] = (
+        zip(*values)
+        if selected_ids is None
+        else (
+            tuple(column[row] for column in values)
+            for row in sorted(frozenset(selected_ids))
+        )
+    )
+    log.log(LOG_LEVEL, "\n".join(map(str, (fields, *rows, fields))))
 
 
 def print_branches(
@@ -152,15 +194,8 @@ def print_branches(
         "pctRate1",
     ),
 ) -> None:
-    values: tuple[list[FieldType], ...] = tuple(
-        get_branch_field(field_name) for field_name in branch_fields
-    )
-
-    log.log(LOG_LEVEL, branch_fields)
-    for row in range(len(values[0])):
-        if selected_ids is None or row in selected_ids:
-            log.log(LOG_LEVEL, tuple(values[col][row] for col in range(len(values))))
-    log.log(LOG_LEVEL, branch_fields)
+    if log.isEnabledFor(LOG_LEVEL):
+        _log_table(branch_fields, get_fields("abrn", branch_fields), selected_ids)
 
 
 def print_buses(
@@ -175,15 +210,8 @@ def print_buses(
         "nVLmLo",
     ),
 ) -> None:
-    values: tuple[list[FieldType], ...] = tuple(
-        get_bus_field(field_name) for field_name in bus_fields
-    )
-
-    log.log(LOG_LEVEL, bus_fields)
-    for row in range(len(values[0])):
-        if selected_ids is None or row in selected_ids:
-            log.log(LOG_LEVEL, tuple(values[col][row] for col in range(len(values))))
-    log.log(LOG_LEVEL, bus_fields)
+    if log.isEnabledFor(LOG_LEVEL):
+        _log_table(bus_fields, get_fields("abus", bus_fields), selected_ids)
 
 
 def print_loads(
@@ -195,15 +223,8 @@ def print_loads(
         "mvaAct",
     ),
 ) -> None:
-    values: tuple[list[FieldType], ...] = tuple(
-        get_load_field(field_name) for field_name in load_fields
-    )
-
-    log.log(LOG_LEVEL, load_fields)
-    for row in range(len(values[0])):
-        if selected_ids is None or row in selected_ids:
-            log.log(LOG_LEVEL, tuple(values[col][row] for col in range(len(values))))
-    log.log(LOG_LEVEL, load_fields)
+    if log.isEnabledFor(LOG_LEVEL):
+        _log_table(load_fields, get_fields("aload", load_fields), selected_ids)
 
 
 def print_swing_buses(
@@ -215,16 +236,20 @@ def print_swing_buses(
         "pqGen",
     ),
 ) -> None:
-    values: tuple[list[FieldType], ...] = tuple(
-        get_plant_bus_field(field_name) for field_name in plant_bus_fields
+    if not log.isEnabledFor(LOG_LEVEL):
+        return
+    # The buses types are retrieved in the same batch as the printed fields
+    *values, buses_types = get_fields("agenbus", (*plant_bus_fields, "type"))
+    swing_buses_rows: list[int] = np.flatnonzero(
+        np.asarray(buses_types) == SWING_BUS
+    ).tolist()
+    _log_table(
+        plant_bus_fields,
+        values,
+        swing_buses_rows
+        if selected_ids is None
+        else frozenset(swing_buses_rows).intersection(selected_ids),
     )
-    buses_types: list[int] = wf.agenbusint(string="type")[0]
-
-    log.log(LOG_LEVEL, plant_bus_fields)
-    for row, bus_type in zip(range(len(values[0])), buses_types):
-        if bus_type == SWING_BUS and (selected_ids is None or row in selected_ids):
-            log.log(LOG_LEVEL, tuple(values[col][row] for col in range(len(values))))
-    log.log(LOG_LEVEL, plant_bus_fields)
 
 
 def print_trafos(
@@ -241,15 +266,8 @@ def print_trafos(
         "pctRate1",
     ),
 ) -> None:
-    values: tuple[list[FieldType], ...] = tuple(
-        get_trafo_field(field_name) for field_name in trafo_fields
-    )
-
-    log.log(LOG_LEVEL, trafo_fields)
-    for row in range(len(values[0])):
-        if selected_ids is None or row in selected_ids:
-            log.log(LOG_LEVEL, tuple(values[col][row] for col in range(len(values))))
-    log.log(LOG_LEVEL, trafo_fields)
+    if log.isEnabledFor(LOG_LEVEL):
+        _log_table(trafo_fields, get_fields("atrn", trafo_fields), selected_ids)
 
 
 def print_trafos_3w(
@@ -268,12 +286,5 @@ def print_trafos_3w(
         "pctRate1",
     ),
 ) -> None:
-    values: tuple[list[FieldType], ...] = tuple(
-        get_trafo_3w_field(field_name) for field_name in trafo_3w_fields
-    )
-
-    log.log(LOG_LEVEL, trafo_3w_fields)
-    for row in range(len(values[0])):
-        if selected_ids is None or row in selected_ids:
-            log.log(LOG_LEVEL, tuple(values[col][row] for col in range(len(values))))
-    log.log(LOG_LEVEL, trafo_3w_fields)
+    if log.isEnabledFor(LOG_LEVEL):
+        _log_table(trafo_3w_fields, get_fields("awnd", trafo_3w_fields), selected_ids)
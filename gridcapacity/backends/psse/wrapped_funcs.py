@@ -316,7 +316,7 @@ def load_data_6(_bus: int, _id: str, **_: Any) -> None:
 
 
 @process_psse_api_error_code
-def load_chng_6() -> None:
+def load_chng_6(_bus: int, _id: str, **_: Any) -> None:
     pass  # Functionality is implemented by wrapped PSSE API function
 
 
@@ -331,7 +331,7 @@ def machine_data_4(_bus: int, _id: str, **_: Any) -> None:
 
 
 @process_psse_api_error_code
-def machine_chng_4() -> None:
+def machine_chng_4(_bus: int, _id: str, **_: Any) -> None:
     pass  # Functionality is implemented by wrapped PSSE API function
 
 
@@ -481,10 +481,14 @@ def open_case(case_name: str) -> None:
 def run_solver(
     use_full_newton_raphson: bool,
     solver_opts: Optional[dict] = None,
+    warm_start: bool = False,
 ) -> None:
     """Default solver options:
     `options1=1` Use tap adjustment option setting
     `options5=1` Use switched shunt adjustment option setting
+
+    PSSE solutions start from the present voltages unless `options6`
+    requests a flat start, so `warm_start` needs no extra option.
     """
     effective_solver_opts = solver_opts or {"options1": 1, "options5": 1}
     try:
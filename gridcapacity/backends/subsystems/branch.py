@@ -13,8 +13,8 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-import dataclasses
 import logging
+import operator
 import sys
 from abc import abstractmethod
 from collections.abc import Iterator, Sequence
@@ -22,8 +22,11 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Generic, Optional, TypeVar, Union, overload
 
+import numpy as np
+
 from ...envs import envs
-from .utils import Printable
+from ...utils import DATACLASS_SLOTS
+from .utils import Printable, get_field_names, get_indexes_above, get_values_at
 
 if sys.platform == "win32" and not envs.pandapower_backend:
     import psspy
@@ -35,7 +38,7 @@ else:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Branch:
     from_number: int
     to_number: int
@@ -125,21 +128,17 @@ class GenericBranches(Sequence, Printable, Generic[GenericBranch]):
             loadings_pct = self._psse_branches.pct_rate
         else:
             loadings_pct = pp_backend.net.res_line.loading_percent
-        return tuple(
-            branch_idx
-            for branch_idx, pct_rate in enumerate(loadings_pct)
-            if pct_rate > max_branch_loading_pct
-        )
+        return get_indexes_above(loadings_pct, max_branch_loading_pct)
 
     def get_loading_pct(
         self,
         selected_indexes: tuple[int, ...],
     ) -> tuple[float, ...]:
         if sys.platform == "win32" and not envs.pandapower_backend:
-            return tuple(self._psse_branches.pct_rate[idx] for idx in selected_indexes)
-        return tuple(
-            pp_backend.net.res_line.loading_percent.iat[idx] for idx in selected_indexes
-        )
+            loadings_pct = self._psse_branches.pct_rate
+        else:
+            loadings_pct = pp_backend.net.res_line.loading_percent
+        return get_values_at(loadings_pct, selected_indexes)
 
     def log(
         self,
@@ -148,25 +147,22 @@ class GenericBranches(Sequence, Printable, Generic[GenericBranch]):
     ) -> None:
         if not log.isEnabledFor(level):
             return
-        branch_fields: tuple[str, ...] = tuple(
-            (*dataclasses.asdict(self[0]).keys(), f"pct{self._rate}")
+        selected_rows: Optional[frozenset[int]] = (
+            None if selected_indexes is None else frozenset(selected_indexes)
         )
+        branch_fields: tuple[str, ...] = (
+            *get_field_names(type(self[0])),
+            f"pct{self._rate}",
+        )
+        branch_values = operator.attrgetter(*branch_fields[:-1])
         self._log.log(level, branch_fields)
-        for idx, branch in enumerate(self):
-            if selected_indexes is None or idx in selected_indexes:
+        for idx in range(len(self)):
+            if selected_rows is None or idx in selected_rows:
                 if sys.platform == "win32" and not envs.pandapower_backend:
                     loading_pct = self._psse_branches.pct_rate[idx]
                 else:
                     loading_pct = pp_backend.net.res_line.loading_percent.iat[idx]
-                self._log.log(
-                    level,
-                    tuple(
-                        (
-                            *dataclasses.astuple(branch),
-                            loading_pct,
-                        )
-                    ),
-                )
+                self._log.log(level, (*branch_values(self[idx]), loading_pct))
         self._log.log(level, branch_fields)
 
 
@@ -175,32 +171,36 @@ class PsseBranches:
     from_number: list[int]
     to_number: list[int]
     branch_id: list[str]
-    pct_rate: list[float]
+    pct_rate: np.ndarray
 
 
 class Branches(GenericBranches[Branch]):
     def __init__(self, rate: str = "Rate1") -> None:
         super().__init__(rate)
         if sys.platform == "win32" and not envs.pandapower_backend:
+            from_numbers, to_numbers = wf.abrnint(string=["fromNumber", "toNumber"])
             self._psse_branches: PsseBranches = PsseBranches(
-                wf.abrnint(string="fromNumber")[0],
-                wf.abrnint(string="toNumber")[0],
+                from_numbers,
+                to_numbers,
                 wf.abrnchar(string="id")[0],
-                wf.abrnreal(string=f"pct{self._rate}")[0],
+                np.asarray(wf.abrnreal(string=f"pct{self._rate}")[0], dtype=np.float64),
             )
+            self._cached_branches: list[Optional[Branch]] = [None] * len(self)
 
     def __getitem__(self, idx: Union[int, slice]) -> Union[Branch, tuple[Branch, ...]]:
         if sys.platform == "win32" and not envs.pandapower_backend:
             if isinstance(idx, int):
-                return Branch(
-                    self._psse_branches.from_number[idx],
-                    self._psse_branches.to_number[idx],
-                    self._psse_branches.branch_id[idx],
-                )
+                if (branch := self._cached_branches[idx]) is None:
+                    branch = self._cached_branches[idx] = Branch(
+                        self._psse_branches.from_number[idx],
+                        self._psse_branches.to_number[idx],
+                        self._psse_branches.branch_id[idx],
+                    )
+                return branch
             if isinstance(idx, slice):
                 return tuple(
-                    Branch(*args)
-                    for args in zip(
+                    map(
+                        Branch,
                         self._psse_branches.from_number[idx],
                         self._psse_branches.to_number[idx],
                         self._psse_branches.branch_id[idx],
@@ -226,8 +226,8 @@ class Branches(GenericBranches[Branch]):
                 )
             if isinstance(idx, slice):
                 return tuple(
-                    branch_from_pp(*args)
-                    for args in zip(
+                    map(
+                        branch_from_pp,
                         pp_backend.net.line.from_bus[idx],
                         pp_backend.net.line.to_bus[idx],
                         pp_backend.net.line.parallel[idx],
@@ -266,8 +266,8 @@ class DataExportBranches(GenericBranches[DataExportBranch]):
             )
         if isinstance(idx, slice):
             return tuple(
-                DataExportBranch(*args)
-                for args in zip(
+                map(
+                    DataExportBranch,
                     self._psse_branches.from_number[idx],
                     self._psse_branches.to_number[idx],
                     self._psse_branches.branch_id[idx],
@@ -15,6 +15,7 @@ limitations under the License.
 """
 import dataclasses
 import logging
+import operator
 import sys
 from abc import abstractmethod
 from collections.abc import Iterator, Sequence
@@ -22,11 +23,20 @@ from dataclasses import dataclass
 from types import TracebackType
 from typing import Generic, Optional, TypeVar, Union, overload
 
+import numpy as np
+
 from ...envs import envs
+from ...utils import DATACLASS_SLOTS
 from .area import AreaByNumber
 from .gen import Machine, Machines
 from .load import Load, Loads
-from .utils import Printable
+from .utils import (
+    Printable,
+    get_field_names,
+    get_indexes_above,
+    get_indexes_below,
+    get_values_at,
+)
 from .zone import ZoneByNumber
 
 if sys.platform == "win32" and not envs.pandapower_backend:
@@ -41,7 +51,7 @@ else:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class BusBase:
     number: int
 
@@ -100,7 +110,7 @@ class BusBase:
         return actual_gen_mva
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Bus(BusBase):
     ex_name: str
     type: int
@@ -201,30 +211,24 @@ class GenericBuses(Sequence, Printable, Generic[GenericBus]):
             pu_voltages = self._psse_buses.pu
         else:
             pu_voltages = pp_backend.net.res_bus.vm_pu
-        return tuple(
-            bus_id
-            for bus_id, pu_voltage in enumerate(pu_voltages)
-            if pu_voltage > max_bus_voltage
-        )
+        return get_indexes_above(pu_voltages, max_bus_voltage)
 
     def get_undervoltage_indexes(self, min_bus_voltage: float) -> tuple[int, ...]:
         if sys.platform == "win32" and not envs.pandapower_backend:
             pu_voltages = self._psse_buses.pu
         else:
             pu_voltages = pp_backend.net.res_bus.vm_pu
-        return tuple(
-            bus_id
-            for bus_id, pu_voltage in enumerate(pu_voltages)
-            if pu_voltage < min_bus_voltage
-        )
+        return get_indexes_below(pu_voltages, min_bus_voltage)
 
     def get_voltage_pu(
         self,
         selected_indexes: tuple[int, ...],
     ) -> tuple[float, ...]:
         if sys.platform == "win32" and not envs.pandapower_backend:
-            return tuple(self._psse_buses.pu[idx] for idx in selected_indexes)
-        return tuple(pp_backend.net.res_bus.vm_pu.iat[idx] for idx in selected_indexes)
+            pu_voltages = self._psse_buses.pu
+        else:
+            pu_voltages = pp_backend.net.res_bus.vm_pu
+        return get_values_at(pu_voltages, selected_indexes)
 
     def log(
         self,
@@ -233,19 +237,20 @@ class GenericBuses(Sequence, Printable, Generic[GenericBus]):
     ) -> None:
         if not log.isEnabledFor(level):
             return
-        bus_fields: tuple[str, ...] = tuple((*dataclasses.asdict(self[0]).keys(), "pu"))
+        selected_rows: Optional[frozenset[int]] = (
+            None if selected_indexes is None else frozenset(selected_indexes)
+        )
+        bus_fields: tuple[str, ...] = (*get_field_names(type(self[0])), "pu")
+        bus_values = operator.attrgetter(*bus_fields[:-1])
         self._log.log(level, bus_fields)
-        for idx, bus in enumerate(self):
-            if selected_indexes is None or idx in selected_indexes:
+        for idx in range(len(self)):
+            if selected_rows is None or idx in selected_rows:
                 pu: float
                 if sys.platform == "win32" and not envs.pandapower_backend:
                     pu = self._psse_buses.pu[idx]
                 else:
                     pu = pp_backend.net.res_bus.vm_pu.iat[idx]
-                self._log.log(
-                    level,
-                    tuple((*dataclasses.astuple(bus), pu)),
-                )
+                self._log.log(level, (*bus_values(self[idx]), pu))
         self._log.log(level, bus_fields)
 
 
@@ -254,32 +259,36 @@ class PsseBuses:
     number: list[int]
     ex_name: list[str]
     bus_type: list[int]
-    pu: list[float]
+    pu: np.ndarray
 
 
 class Buses(GenericBuses[Bus]):
     def __init__(self) -> None:
         super().__init__()
         if sys.platform == "win32" and not envs.pandapower_backend:
+            numbers, buses_types = wf.abusint(string=["number", "type"])
             self._psse_buses = PsseBuses(
-                wf.abusint(string="number")[0],
+                numbers,
                 wf.abuschar(string="exName")[0],
-                wf.abusint(string="type")[0],
-                wf.abusreal(string="pu")[0],
+                buses_types,
+                np.asarray(wf.abusreal(string="pu")[0], dtype=np.float64),
             )
+            self._cached_buses: list[Optional[Bus]] = [None] * len(self)
 
     def __getitem__(self, idx: Union[int, slice]) -> Union[Bus, tuple[Bus, ...]]:
         if sys.platform == "win32" and not envs.pandapower_backend:
             if isinstance(idx, int):
-                return Bus(
-                    self._psse_buses.number[idx],
-                    self._psse_buses.ex_name[idx],
-                    self._psse_buses.bus_type[idx],
-                )
+                if (bus := self._cached_buses[idx]) is None:
+                    bus = self._cached_buses[idx] = Bus(
+                        self._psse_buses.number[idx],
+                        self._psse_buses.ex_name[idx],
+                        self._psse_buses.bus_type[idx],
+                    )
+                return bus
             if isinstance(idx, slice):
                 return tuple(
-                    Bus(*args)
-                    for args in zip(
+                    map(
+                        Bus,
                         self._psse_buses.number[idx],
                         self._psse_buses.ex_name[idx],
                         self._psse_buses.bus_type[idx],
@@ -303,8 +312,8 @@ class Buses(GenericBuses[Bus]):
                 )
             if isinstance(idx, slice):
                 return tuple(
-                    bus_from_pp(*args)
-                    for args in zip(
+                    map(
+                        bus_from_pp,
                         pp_backend.net.bus.name[idx],
                         pp_backend.net.bus.vn_kv[idx],
                         pp_backend.net.bus.zone[idx],
@@ -359,8 +368,8 @@ class DataExportBuses(GenericBuses[DataExportBus]):
             )
         if isinstance(idx, slice):
             return tuple(
-                DataExportBus(*args)
-                for args in zip(
+                map(
+                    DataExportBus,
                     self._psse_buses.number[idx],
                     self._psse_buses.name[idx],
                     self._psse_buses.bus_type[idx],
@@ -381,9 +390,11 @@ class TemporaryBusLoad:
     def __init__(self, bus: Bus) -> None:
         self._bus: Bus = bus
         self._load_mva: complex
+        self._is_added: bool = False
 
     def __enter__(self) -> None:
-        self._bus.add_load(self._load_mva)
+        self._bus.add_load(self._load_mva, self.TEMP_LOAD_ID)
+        self._is_added = True
 
     def __exit__(
         self,
@@ -391,6 +402,9 @@ class TemporaryBusLoad:
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
+        if not self._is_added:
+            return
+        self._is_added = False
         # Delete load
         if sys.platform == "win32" and not envs.pandapower_backend:
             wf.purgload(self._bus.number, self.TEMP_LOAD_ID)
@@ -403,6 +417,29 @@ class TemporaryBusLoad:
         self._load_mva = load_mva
         return self
 
+    def set_power(self, load_mva: complex) -> None:
+        """Change the temporary load power in place
+
+        The load is added again if it was purged by a case reload.
+        """
+        self._load_mva = load_mva
+        if not self._is_added:
+            self.__enter__()
+        elif sys.platform == "win32" and not envs.pandapower_backend:
+            wf.load_chng_6(
+                self._bus.number,
+                self.TEMP_LOAD_ID,
+                realar=[load_mva.real, load_mva.imag],
+            )
+        else:
+            pp_backend.net.load.loc[
+                pp_backend.net.load.name == self.TEMP_LOAD_ID, ["p_mw", "q_mvar"]
+            ] = (load_mva.real, load_mva.imag)
+
+    def mark_purged(self) -> None:
+        """Mark the temporary load as purged by a case reload"""
+        self._is_added = False
+
     @property
     def bus(self) -> Bus:
         return self._bus
@@ -418,9 +455,11 @@ class TemporaryBusMachine:
     def __init__(self, bus: Bus) -> None:
         self._bus: Bus = bus
         self._gen_mva: complex
+        self._is_added: bool = False
 
     def __enter__(self) -> None:
-        self._bus.add_gen(self._gen_mva)
+        self._bus.add_gen(self._gen_mva, self.TEMP_MACHINE_ID)
+        self._is_added = True
 
     def __exit__(
         self,
@@ -428,6 +467,9 @@ class TemporaryBusMachine:
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
+        if not self._is_added:
+            return
+        self._is_added = False
         # Delete machine
         if sys.platform == "win32" and not envs.pandapower_backend:
             wf.purgmac(self._bus.number, self.TEMP_MACHINE_ID)
@@ -442,6 +484,29 @@ class TemporaryBusMachine:
         self._gen_mva = gen_mva
         return self
 
+    def set_power(self, gen_mva: complex) -> None:
+        """Change the temporary machine power in place
+
+        The machine is added again if it was purged by a case reload.
+        """
+        self._gen_mva = gen_mva
+        if not self._is_added:
+            self.__enter__()
+        elif sys.platform == "win32" and not envs.pandapower_backend:
+            wf.machine_chng_4(
+                self._bus.number,
+                self.TEMP_MACHINE_ID,
+                realar=[gen_mva.real, gen_mva.imag],
+            )
+        else:
+            pp_backend.net.sgen.loc[
+                pp_backend.net.sgen.name == self.TEMP_MACHINE_ID, ["p_mw", "q_mvar"]
+            ] = (gen_mva.real, gen_mva.imag)
+
+    def mark_purged(self) -> None:
+        """Mark the temporary machine as purged by a case reload"""
+        self._is_added = False
+
     @property
     def bus(self) -> Bus:
         return self._bus
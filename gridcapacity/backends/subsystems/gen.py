@@ -21,6 +21,7 @@ from dataclasses import dataclass
 from typing import Generic, TypeVar
 
 from ...envs import envs
+from ...utils import DATACLASS_SLOTS
 from .area import AreaByNumber
 from .utils import Printable
 from .zone import ZoneByNumber
@@ -35,7 +36,7 @@ else:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Machine:
     number: int
     ex_name: str
@@ -128,8 +129,10 @@ class Machines(GenericMachines[Machine, PsseMachines]):
                         pp_backend.net.bus.name[pp_backend.net.sgen.bus[machine_idx]],
                         "",
                         pp_backend.net.sgen.name[machine_idx],
-                        pp_backend.net.res_sgen.p_mw[machine_idx]
-                        + 1j * pp_backend.net.res_sgen.q_mvar[machine_idx],
+                        complex(
+                            pp_backend.net.res_sgen.p_mw[machine_idx],
+                            pp_backend.net.res_sgen.q_mvar[machine_idx],
+                        ),
                     )
                 else:
                     machine_idx -= len(pp_backend.net.sgen)
@@ -137,8 +140,10 @@ class Machines(GenericMachines[Machine, PsseMachines]):
                         pp_backend.net.bus.name[pp_backend.net.gen.bus[machine_idx]],
                         "",
                         pp_backend.net.gen.name[machine_idx],
-                        pp_backend.net.res_gen.p_mw[machine_idx]
-                        + 1j * pp_backend.net.res_gen.q_mvar[machine_idx],
+                        complex(
+                            pp_backend.net.res_gen.p_mw[machine_idx],
+                            pp_backend.net.res_gen.q_mvar[machine_idx],
+                        ),
                     )
 
 
@@ -21,8 +21,9 @@ from dataclasses import dataclass
 from typing import Generic, TypeVar
 
 from ...envs import envs
+from ...utils import DATACLASS_SLOTS
 from .area import AreaByNumber
-from .utils import Printable
+from .utils import Printable, sum_by_key
 from .zone import ZoneByNumber
 
 if sys.platform == "win32" and not envs.pandapower_backend:
@@ -35,7 +36,7 @@ else:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Load:
     number: int
     ex_name: str
@@ -121,10 +122,21 @@ class Loads(GenericLoads[Load, PsseLoads]):
                     pp_backend.net.bus.name[pp_backend.net.load.bus[load_idx]],
                     "",
                     pp_backend.net.load.name[load_idx],
-                    pp_backend.net.load.p_mw[load_idx]
-                    + 1j * pp_backend.net.load.q_mvar[load_idx],
+                    complex(
+                        pp_backend.net.load.p_mw[load_idx],
+                        pp_backend.net.load.q_mvar[load_idx],
+                    ),
                 )
 
+    def mva_act_by_bus(self) -> dict[int, complex]:
+        """Return total actual load of every bus having loads"""
+        if sys.platform == "win32" and not envs.pandapower_backend:
+            return sum_by_key(self._raw_loads.number, self._raw_loads.mva_act)
+        return sum_by_key(
+            pp_backend.net.bus.name.loc[pp_backend.net.load.bus].to_numpy(),
+            (pp_backend.net.load.p_mw + 1j * pp_backend.net.load.q_mvar).to_numpy(),
+        )
+
 
 class DataExportLoads(GenericLoads[DataExportLoad, DataExportPsseLoads]):
     def __init__(self) -> None:
@@ -13,14 +13,17 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-import dataclasses
 import logging
+import operator
 import sys
 from dataclasses import dataclass
 from typing import Final, Iterator, Optional, Sequence, Union, overload
 
+import numpy as np
+
 from ...envs import envs
-from .utils import Printable
+from ...utils import DATACLASS_SLOTS
+from .utils import Printable, get_field_names, get_indexes_above, get_values_at
 
 if sys.platform == "win32" and not envs.pandapower_backend:
     import psspy
@@ -32,7 +35,7 @@ else:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SwingBus:
     number: int
     ex_name: str
@@ -42,7 +45,7 @@ class SwingBus:
 class PsseSwingBuses:
     number: list[int]
     ex_name: list[str]
-    pgen: list[float]
+    pgen: np.ndarray
 
 
 class SwingBuses(Sequence, Printable):
@@ -52,20 +55,16 @@ class SwingBuses(Sequence, Printable):
             # PSSE returns all buses, not only swing buses
             # Filter out all buses except swing buses (`type==3`)
             swing_bus_type: Final[int] = 3
+            numbers, buses_types = wf.agenbusint(string=["number", "type"])
+            ex_names = np.asarray(wf.agenbuschar(string="exName")[0], dtype=object)
+            powers_p_mw = np.asarray(wf.agenbusreal(string="pgen")[0], dtype=np.float64)
+            is_swing_bus: np.ndarray = np.asarray(buses_types) == swing_bus_type
             self._raw_buses: PsseSwingBuses = PsseSwingBuses(
-                *zip(
-                    *(
-                        (number, ex_name, pgen)
-                        for number, ex_name, pgen, bus_type in zip(
-                            wf.agenbusint(string="number")[0],
-                            wf.agenbuschar(string="exName")[0],
-                            wf.agenbusreal(string="pgen")[0],
-                            wf.agenbusint(string="type")[0],
-                        )
-                        if bus_type == swing_bus_type
-                    )
-                )
+                np.asarray(numbers)[is_swing_bus].tolist(),
+                ex_names[is_swing_bus].tolist(),
+                powers_p_mw[is_swing_bus],
             )
+            self._cached_swing_buses: list[Optional[SwingBus]] = [None] * len(self)
 
     @overload
     def __getitem__(self, idx: int) -> SwingBus:
@@ -80,14 +79,16 @@ class SwingBuses(Sequence, Printable):
     ) -> Union[SwingBus, tuple[SwingBus, ...]]:
         if sys.platform == "win32" and not envs.pandapower_backend:
             if isinstance(idx, int):
-                return SwingBus(
-                    self._raw_buses.number[idx],
-                    self._raw_buses.ex_name[idx],
-                )
+                if (swing_bus := self._cached_swing_buses[idx]) is None:
+                    swing_bus = self._cached_swing_buses[idx] = SwingBus(
+                        self._raw_buses.number[idx],
+                        self._raw_buses.ex_name[idx],
+                    )
+                return swing_bus
             if isinstance(idx, slice):
                 return tuple(
-                    SwingBus(*args)
-                    for args in zip(
+                    map(
+                        SwingBus,
                         self._raw_buses.number[idx],
                         self._raw_buses.ex_name[idx],
                     )
@@ -108,8 +109,8 @@ class SwingBuses(Sequence, Printable):
                 )
             if isinstance(idx, slice):
                 return tuple(
-                    swing_bus_from_pp(*args)
-                    for args in zip(
+                    map(
+                        swing_bus_from_pp,
                         pp_backend.net.ext_grid.bus[idx],
                         pp_backend.net.ext_grid.vm_pu[idx],
                         pp_backend.net.ext_grid.max_p_mw[idx],
@@ -134,21 +135,17 @@ class SwingBuses(Sequence, Printable):
             powers_p_mw = self._raw_buses.pgen
         else:
             powers_p_mw = pp_backend.net.res_ext_grid.p_mw
-        return tuple(
-            bus_idx
-            for bus_idx, power_p_mw in enumerate(powers_p_mw)
-            if power_p_mw > max_swing_bus_power_p_mw
-        )
+        return get_indexes_above(powers_p_mw, max_swing_bus_power_p_mw)
 
     def get_power_p_mw(
         self,
         selected_indexes: tuple[int, ...],
     ) -> tuple[float, ...]:
         if sys.platform == "win32" and not envs.pandapower_backend:
-            return tuple(self._raw_buses.pgen[idx] for idx in selected_indexes)
-        return tuple(
-            pp_backend.net.res_ext_grid.p_mw.iat[idx] for idx in selected_indexes
-        )
+            powers_p_mw = self._raw_buses.pgen
+        else:
+            powers_p_mw = pp_backend.net.res_ext_grid.p_mw
+        return get_values_at(powers_p_mw, selected_indexes)
 
     def log(
         self,
@@ -157,19 +154,18 @@ class SwingBuses(Sequence, Printable):
     ) -> None:
         if not log.isEnabledFor(level):
             return
-        bus_fields: tuple[str, ...] = tuple(
-            (*dataclasses.asdict(self[0]).keys(), "pgen")
+        selected_rows: Optional[frozenset[int]] = (
+            None if selected_indexes is None else frozenset(selected_indexes)
         )
+        bus_fields: tuple[str, ...] = (*get_field_names(type(self[0])), "pgen")
+        bus_values = operator.attrgetter(*bus_fields[:-1])
         self._log.log(level, bus_fields)
-        for idx, bus in enumerate(self):
-            if selected_indexes is None or idx in selected_indexes:
+        for idx in range(len(self)):
+            if selected_rows is None or idx in selected_rows:
                 p_mw: float
                 if sys.platform == "win32" and not envs.pandapower_backend:
                     p_mw = self._raw_buses.pgen[idx]
                 else:
                     p_mw = pp_backend.net.res_ext_grid.p_mw.iat[idx]
-                self._log.log(
-                    level,
-                    tuple((*dataclasses.astuple(bus), p_mw)),
-                )
+                self._log.log(level, (*bus_values(self[idx]), p_mw))
         self._log.log(level, bus_fields)
@@ -13,8 +13,8 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-import dataclasses
 import logging
+import operator
 import sys
 from abc import abstractmethod
 from collections.abc import Iterator, Sequence
@@ -22,8 +22,11 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Generic, Optional, TypeVar, Union, overload
 
+import numpy as np
+
 from ...envs import envs
-from .utils import Printable
+from ...utils import DATACLASS_SLOTS
+from .utils import Printable, get_field_names, get_indexes_above, get_values_at
 
 if sys.platform == "win32" and not envs.pandapower_backend:
     import psspy
@@ -35,7 +38,7 @@ else:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Trafo:
     from_number: int
     to_number: int
@@ -114,22 +117,17 @@ class GenericTrafos(Sequence, Printable, Generic[GenericTrafo]):
             loadings_pct = self._raw_trafos.pct_rate
         else:
             loadings_pct = pp_backend.net.res_trafo.loading_percent
-        return tuple(
-            trafo_idx
-            for trafo_idx, pct_rate in enumerate(loadings_pct)
-            if pct_rate > max_trafo_loading_pct
-        )
+        return get_indexes_above(loadings_pct, max_trafo_loading_pct)
 
     def get_loading_pct(
         self,
         selected_indexes: tuple[int, ...],
     ) -> tuple[float, ...]:
         if sys.platform == "win32" and not envs.pandapower_backend:
-            return tuple(self._raw_trafos.pct_rate[idx] for idx in selected_indexes)
-        return tuple(
-            pp_backend.net.res_trafo.loading_percent.iat[idx]
-            for idx in selected_indexes
-        )
+            loadings_pct = self._raw_trafos.pct_rate
+        else:
+            loadings_pct = pp_backend.net.res_trafo.loading_percent
+        return get_values_at(loadings_pct, selected_indexes)
 
     def log(
         self,
@@ -138,25 +136,22 @@ class GenericTrafos(Sequence, Printable, Generic[GenericTrafo]):
     ) -> None:
         if not log.isEnabledFor(level):
             return
-        trafo_fields: tuple[str, ...] = tuple(
-            (*dataclasses.asdict(self[0]).keys(), f"pct{self._rate}")
+        selected_rows: Optional[frozenset[int]] = (
+            None if selected_indexes is None else frozenset(selected_indexes)
         )
+        trafo_fields: tuple[str, ...] = (
+            *get_field_names(type(self[0])),
+            f"pct{self._rate}",
+        )
+        trafo_values = operator.attrgetter(*trafo_fields[:-1])
         self._log.log(level, trafo_fields)
-        for idx, trafo in enumerate(self):
-            if selected_indexes is None or idx in selected_indexes:
+        for idx in range(len(self)):
+            if selected_rows is None or idx in selected_rows:
                 if sys.platform == "win32" and not envs.pandapower_backend:
                     loading_pct = self._raw_trafos.pct_rate[idx]
                 else:
                     loading_pct = pp_backend.net.res_trafo.loading_percent.iat[idx]
-                self._log.log(
-                    level,
-                    tuple(
-                        (
-                            *dataclasses.astuple(trafo),
-                            loading_pct,
-                        )
-                    ),
-                )
+                self._log.log(level, (*trafo_values(self[idx]), loading_pct))
         self._log.log(level, trafo_fields)
 
 
@@ -165,19 +160,21 @@ class PsseTrafos:
     from_number: list[int]
     to_number: list[int]
     trafo_id: list[str]
-    pct_rate: list[float]
+    pct_rate: np.ndarray
 
 
 class Trafos(GenericTrafos[Trafo]):
     def __init__(self, rate: str = "Rate1") -> None:
         super().__init__(rate)
         if sys.platform == "win32" and not envs.pandapower_backend:
+            from_numbers, to_numbers = wf.atrnint(string=["fromNumber", "toNumber"])
             self._raw_trafos: PsseTrafos = PsseTrafos(
-                wf.atrnint(string="fromNumber")[0],
-                wf.atrnint(string="toNumber")[0],
+                from_numbers,
+                to_numbers,
                 wf.atrnchar(string="id")[0],
-                wf.atrnreal(string=f"pct{self._rate}")[0],
+                np.asarray(wf.atrnreal(string=f"pct{self._rate}")[0], dtype=np.float64),
             )
+            self._cached_trafos: list[Optional[Trafo]] = [None] * len(self)
 
     @overload
     def __getitem__(self, idx: int) -> Trafo:
@@ -190,15 +187,17 @@ class Trafos(GenericTrafos[Trafo]):
     def __getitem__(self, idx: Union[int, slice]) -> Union[Trafo, tuple[Trafo, ...]]:
         if sys.platform == "win32" and not envs.pandapower_backend:
             if isinstance(idx, int):
-                return Trafo(
-                    self._raw_trafos.from_number[idx],
-                    self._raw_trafos.to_number[idx],
-                    self._raw_trafos.trafo_id[idx],
-                )
+                if (trafo := self._cached_trafos[idx]) is None:
+                    trafo = self._cached_trafos[idx] = Trafo(
+                        self._raw_trafos.from_number[idx],
+                        self._raw_trafos.to_number[idx],
+                        self._raw_trafos.trafo_id[idx],
+                    )
+                return trafo
             if isinstance(idx, slice):
                 return tuple(
-                    Trafo(*args)
-                    for args in zip(
+                    map(
+                        Trafo,
                         self._raw_trafos.from_number[idx],
                         self._raw_trafos.to_number[idx],
                         self._raw_trafos.trafo_id[idx],
@@ -224,8 +223,8 @@ class Trafos(GenericTrafos[Trafo]):
                 )
             if isinstance(idx, slice):
                 return tuple(
-                    trafo_from_pp(*args)
-                    for args in zip(
+                    map(
+                        trafo_from_pp,
                         pp_backend.net.trafo.hv_bus[idx],
                         pp_backend.net.trafo.lv_bus[idx],
                         pp_backend.net.trafo.parallel[idx],
@@ -264,8 +263,8 @@ class DataExportTrafos(GenericTrafos[DataExportTrafo]):
             )
         if isinstance(idx, slice):
             return tuple(
-                DataExportTrafo(*args)
-                for args in zip(
+                map(
+                    DataExportTrafo,
                     self._raw_trafos.from_number[idx],
                     self._raw_trafos.to_number[idx],
                     self._raw_trafos.trafo_id[idx],
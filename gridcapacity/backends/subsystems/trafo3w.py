@@ -13,16 +13,19 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-import dataclasses
 import logging
+import operator
 import sys
 from abc import abstractmethod
 from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from typing import Generic, Optional, TypeVar, Union, overload
 
+import numpy as np
+
 from ...envs import envs
-from .utils import Printable
+from ...utils import DATACLASS_SLOTS
+from .utils import Printable, get_field_names, get_indexes_above, get_values_at
 
 if sys.platform == "win32" and not envs.pandapower_backend:
     import psspy
@@ -34,7 +37,7 @@ else:
 log = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Trafo3w:
     wind1_number: int
     wind2_number: int
@@ -81,14 +84,6 @@ class GenericTrafos3w(Sequence, Printable, Generic[GenericTrafo3w]):
     def __init__(self, rate: str = "Rate1") -> None:
         self._log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self._rate: str = rate
-        if sys.platform == "win32" and not envs.pandapower_backend:
-            self._raw_trafos: PsseTrafos3w = PsseTrafos3w(
-                wf.awndint(string="wind1Number")[0],
-                wf.awndint(string="wind2Number")[0],
-                wf.awndint(string="wind3Number")[0],
-                wf.awndchar(string="id")[0],
-                wf.awndreal(string=f"pct{self._rate}")[0],
-            )
 
     @overload
     def __getitem__(self, idx: int) -> GenericTrafo3w:
@@ -118,22 +113,17 @@ class GenericTrafos3w(Sequence, Printable, Generic[GenericTrafo3w]):
             loadings_pct = self._raw_trafos.pct_rate
         else:
             loadings_pct = pp_backend.net.res_trafo3w.loading_percent
-        return tuple(
-            trafo_idx
-            for trafo_idx, pct_rate in enumerate(loadings_pct)
-            if pct_rate > max_trafo_loading_pct
-        )
+        return get_indexes_above(loadings_pct, max_trafo_loading_pct)
 
     def get_loading_pct(
         self,
         selected_indexes: tuple[int, ...],
     ) -> tuple[float, ...]:
         if sys.platform == "win32" and not envs.pandapower_backend:
-            return tuple(self._raw_trafos.pct_rate[idx] for idx in selected_indexes)
-        return tuple(
-            pp_backend.net.res_trafo3w.loading_percent.iat[idx]
-            for idx in selected_indexes
-        )
+            loadings_pct = self._raw_trafos.pct_rate
+        else:
+            loadings_pct = pp_backend.net.res_trafo3w.loading_percent
+        return get_values_at(loadings_pct, selected_indexes)
 
     def log(
         self,
@@ -142,25 +132,22 @@ class GenericTrafos3w(Sequence, Printable, Generic[GenericTrafo3w]):
     ) -> None:
         if not log.isEnabledFor(level):
             return
-        trafo_fields: tuple[str, ...] = tuple(
-            (*dataclasses.asdict(self[0]).keys(), f"pct{self._rate}")
+        selected_rows: Optional[frozenset[int]] = (
+            None if selected_indexes is None else frozenset(selected_indexes)
+        )
+        trafo_fields: tuple[str, ...] = (
+            *get_field_names(type(self[0])),
+            f"pct{self._rate}",
         )
+        trafo_values = operator.attrgetter(*trafo_fields[:-1])
         self._log.log(level, trafo_fields)
-        for idx, trafo in enumerate(self):
-            if selected_indexes is None or idx in selected_indexes:
+        for idx in range(len(self)):
+            if selected_rows is None or idx in selected_rows:
                 if sys.platform == "win32" and not envs.pandapower_backend:
                     loadings_pct = self._raw_trafos.pct_rate[idx]
                 else:
                     loadings_pct = pp_backend.net.res_trafo3w.loading_percent.iat[idx]
-                self._log.log(
-                    level,
-                    tuple(
-                        (
-                            *dataclasses.astuple(trafo),
-                            loadings_pct,
-                        )
-                    ),
-                )
+                self._log.log(level, (*trafo_values(self[idx]), loadings_pct))
         self._log.log(level, trafo_fields)
 
 
@@ -170,36 +157,42 @@ class PsseTrafos3w:
     wind2_number: list[int]
     wind3_number: list[int]
     trafo_id: list[str]
-    pct_rate: list[float]
+    pct_rate: np.ndarray
 
 
 class Trafos3w(GenericTrafos3w[Trafo3w]):
     def __init__(self, rate: str = "Rate1") -> None:
         super().__init__(rate)
         if sys.platform == "win32" and not envs.pandapower_backend:
+            wind1_numbers, wind2_numbers, wind3_numbers = wf.awndint(
+                string=["wind1Number", "wind2Number", "wind3Number"]
+            )
             self._raw_trafos: PsseTrafos3w = PsseTrafos3w(
-                wf.awndint(string="wind1Number")[0],
-                wf.awndint(string="wind2Number")[0],
-                wf.awndint(string="wind3Number")[0],
+                wind1_numbers,
+                wind2_numbers,
+                wind3_numbers,
                 wf.awndchar(string="id")[0],
-                wf.awndreal(string=f"pct{self._rate}")[0],
+                np.asarray(wf.awndreal(string=f"pct{self._rate}")[0], dtype=np.float64),
             )
+            self._cached_trafos3w: list[Optional[Trafo3w]] = [None] * len(self)
 
     def __getitem__(
         self, idx: Union[int, slice]
     ) -> Union[Trafo3w, tuple[Trafo3w, ...]]:
         if sys.platform == "win32" and not envs.pandapower_backend:
             if isinstance(idx, int):
-                return Trafo3w(
-                    self._raw_trafos.wind1_number[idx],
-                    self._raw_trafos.wind2_number[idx],
-                    self._raw_trafos.wind3_number[idx],
-                    self._raw_trafos.trafo_id[idx],
-                )
+                if (trafo3w := self._cached_trafos3w[idx]) is None:
+                    trafo3w = self._cached_trafos3w[idx] = Trafo3w(
+                        self._raw_trafos.wind1_number[idx],
+                        self._raw_trafos.wind2_number[idx],
+                        self._raw_trafos.wind3_number[idx],
+                        self._raw_trafos.trafo_id[idx],
+                    )
+                return trafo3w
             if isinstance(idx, slice):
                 return tuple(
-                    Trafo3w(*args)
-                    for args in zip(
+                    map(
+                        Trafo3w,
                         self._raw_trafos.wind1_number[idx],
                         self._raw_trafos.wind2_number[idx],
                         self._raw_trafos.wind3_number[idx],
@@ -232,8 +225,8 @@ class Trafos3w(GenericTrafos3w[Trafo3w]):
                 )
             if isinstance(idx, slice):
                 return tuple(
-                    trafo3w_from_pp(*args)
-                    for args in zip(
+                    map(
+                        trafo3w_from_pp,
                         pp_backend.net.trafo3w.hv_bus[idx],
                         pp_backend.net.trafo3w.mv_bus[idx],
                         pp_backend.net.trafo3w.lv_bus[idx],
@@ -276,8 +269,8 @@ class DataExportTrafos3w(GenericTrafos3w[DataExportTrafo3w]):
             )
         if isinstance(idx, slice):
             return tuple(
-                DataExportTrafo3w(*args)
-                for args in zip(
+                map(
+                    DataExportTrafo3w,
                     self._raw_trafos.wind1_number[idx],
                     self._raw_trafos.wind2_number[idx],
                     self._raw_trafos.wind3_number[idx],
@@ -13,11 +13,46 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import dataclasses
+import functools
+from collections.abc import Collection, Hashable
 from typing import Iterable
 
+import numpy as np
 from rich.pretty import pretty_repr
 
 
 class Printable:
     def __str__(self: Iterable) -> str:
         return pretty_repr({idx: instance for idx, instance in enumerate(self)})
+
+
+@functools.cache
+def get_field_names(dataclass_type: type) -> tuple[str, ...]:
+    """Return the names of the dataclass fields, read once per dataclass"""
+    return tuple(field.name for field in dataclasses.fields(dataclass_type))
+
+
+def get_indexes_above(values: Collection[float], limit: float) -> tuple[int, ...]:
+    """Return indexes of the values above the limit, compared in one NumPy pass"""
+    return tuple(np.flatnonzero(np.asarray(values) > limit).tolist())
+
+
+def get_indexes_below(values: Collection[float], limit: float) -> tuple[int, ...]:
+    """Return indexes of the values below the limit, compared in one NumPy pass"""
+    return tuple(np.flatnonzero(np.asarray(values) < limit).tolist())
+
+
+def get_values_at(
+    values: Collection[float], indexes: Collection[int]
+) -> tuple[float, ...]:
+    """Return the values at the indexes, gathered in one NumPy pass"""
+    return tuple(np.asarray(values)[list(indexes)].tolist())
+
+
+def sum_by_key(keys: Collection[Hashable], values: Collection[complex]) -> dict:
+    """Return the values summed for every key, grouped in one NumPy pass"""
+    unique_keys, key_indexes = np.unique(np.asarray(keys), return_inverse=True)
+    sums: np.ndarray = np.zeros(len(unique_keys), dtype=complex)
+    np.add.at(sums, key_indexes, np.asarray(values, dtype=complex))
+    return dict(zip(unique_keys.tolist(), sums.tolist()))
@@ -16,17 +16,21 @@ limitations under the License.
 """
 import dataclasses
 import logging
+import multiprocessing
 import sys
 from collections import OrderedDict, defaultdict
-from collections.abc import Collection
+from collections.abc import Callable, Collection, Sequence
 from dataclasses import dataclass
-from typing import Any, Final, Generator, Iterator, List, Optional
+from operator import itemgetter
+from typing import Any, Final, Generator, Iterator, Optional, Union, overload
 
-from tqdm import tqdm
+import numpy as np
 
 from gridcapacity.backends.subsystems import (
     Bus,
     Buses,
+    Loads,
+    Machines,
     TemporaryBusLoad,
     TemporaryBusMachine,
     TemporaryBusSubsystem,
@@ -36,8 +40,9 @@ from gridcapacity.contingency_analysis import (
     ContingencyScenario,
     LimitingFactor,
     LimitingSubsystem,
-    get_contingency_limiting_factor,
     get_contingency_scenario,
+    get_contingency_violations_check,
+    get_first_contingency_limiting_factor,
 )
 from gridcapacity.envs import envs
 from gridcapacity.violations_analysis import (
@@ -45,18 +50,20 @@ from gridcapacity.violations_analysis import (
     Violations,
     ViolationsLimits,
     ViolationsStats,
+    ViolationTypeToLimitValue,
+    ViolationTypeToSubsystemIdx,
     check_violations,
     run_solver,
 )
 
 from .backends import wrapped_funcs as wf
 from .config import BusConnection, ConnectionScenario
-from .utils import p_to_mva
+from .utils import DATACLASS_SLOTS, p_to_mva, q_over_p
 
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class BusHeadroom:
     bus: Bus
     actual_load_mva: complex
@@ -67,7 +74,122 @@ class BusHeadroom:
     gen_lf: Optional[LimitingFactor]
 
 
-Headroom = List[BusHeadroom]
+class Headroom(Sequence):
+    """Buses headroom stored column-wise
+
+    The powers are kept in complex NumPy arrays preallocated for the expected
+    number of buses, `BusHeadroom` records are only built on access.
+    """
+
+    __slots__ = (
+        "_size",
+        "_buses",
+        "_actual_load_mva",
+        "_actual_gen_mva",
+        "_load_avail_mva",
+        "_gen_avail_mva",
+        "_load_lf",
+        "_gen_lf",
+    )
+
+    def __init__(self, expected_size: int = 0) -> None:
+        self._size: int = 0
+        self._buses: list[Bus] = []
+        self._actual_load_mva: np.ndarray = np.zeros(expected_size, dtype=complex)
+        self._actual_gen_mva: np.ndarray = np.zeros(expected_size, dtype=complex)
+        self._load_avail_mva: np.ndarray = np.zeros(expected_size, dtype=complex)
+        self._gen_avail_mva: np.ndarray = np.zeros(expected_size, dtype=complex)
+        self._load_lf: list[Optional[LimitingFactor]] = []
+        self._gen_lf: list[Optional[LimitingFactor]] = []
+
+    def append(self, bus_headroom: BusHeadroom) -> None:
+        if self._size == len(self._actual_load_mva):
+            self._grow()
+        idx: int = self._size
+        self._buses.append(bus_headroom.bus)
+        self._actual_load_mva[idx] = bus_headroom.actual_load_mva
+        self._actual_gen_mva[idx] = bus_headroom.actual_gen_mva
+        self._load_avail_mva[idx] = bus_headroom.load_avail_mva
+        self._gen_avail_mva[idx] = bus_headroom.gen_avail_mva
+        self._load_lf.append(bus_headroom.load_lf)
+        self._gen_lf.append(bus_headroom.gen_lf)
+        self._size += 1
+
+    def _grow(self) -> None:
+        """Double the columns capacity when there are more buses than expected"""
+        extra: np.ndarray = np.zeros(max(1, self._size), dtype=complex)
+        self._actual_load_mva = np.append(self._actual_load_mva, extra)
+        self._actual_gen_mva = np.append(self._actual_gen_mva, extra)
+        self._load_avail_mva = np.append(self._load_avail_mva, extra)
+        self._gen_avail_mva = np.append(self._gen_avail_mva, extra)
+
+    @property
+    def buses(self) -> list[Bus]:
+        return self._buses
+
+    @property
+    def actual_load_mva(self) -> np.ndarray:
+        return self._actual_load_mva[: self._size]
+
+    @property
+    def actual_gen_mva(self) -> np.ndarray:
+        return self._actual_gen_mva[: self._size]
+
+    @property
+    def load_avail_mva(self) -> np.ndarray:
+        return self._load_avail_mva[: self._size]
+
+    @property
+    def gen_avail_mva(self) -> np.ndarray:
+        return self._gen_avail_mva[: self._size]
+
+    @overload
+    def __getitem__(self, idx: int) -> BusHeadroom:
+        ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> tuple[BusHeadroom, ...]:
+        ...
+
+    def __getitem__(
+        self, idx: Union[int, slice]
+    ) -> Union[BusHeadroom, tuple[BusHeadroom, ...]]:
+        if isinstance(idx, slice):
+            return tuple(self[i] for i in range(*idx.indices(self._size)))
+        if not -self._size <= idx < self._size:
+            raise IndexError(f"Headroom index {idx} out of range")
+        idx %= self._size
+        return BusHeadroom(
+            bus=self._buses[idx],
+            actual_load_mva=complex(self._actual_load_mva[idx]),
+            actual_gen_mva=complex(self._actual_gen_mva[idx]),
+            load_avail_mva=complex(self._load_avail_mva[idx]),
+            gen_avail_mva=complex(self._gen_avail_mva[idx]),
+            load_lf=self._load_lf[idx],
+            gen_lf=self._gen_lf[idx],
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+
+PowerByBus = dict[int, complex]
+
+
+def get_load_mva_by_bus() -> PowerByBus:
+    """Return total load of every bus having loads"""
+    return Loads().mva_act_by_bus()
+
+
+def get_gen_mva_by_bus() -> PowerByBus:
+    """Return total generation of every bus having machines"""
+    gen_mva_by_bus: PowerByBus = defaultdict(complex)
+    try:
+        for machine in Machines():
+            gen_mva_by_bus[machine.number] += machine.pq_gen
+    except KeyError:
+        pass  # PandaPower throws `KeyError` where `IndexError` is expected
+    return dict(gen_mva_by_bus)
 
 
 @dataclass(frozen=True)
@@ -101,6 +223,31 @@ class CapacityAnalyser:
      - getting limiting factor
     """
 
+    # The attributes are read in every bisection step: no per-instance dict
+    __slots__ = (
+        "_case_name",
+        "_load_power_factor",
+        "_gen_power_factor",
+        "_upper_load_limit_p_mw",
+        "_upper_gen_limit_p_mw",
+        "_load_q_over_p",
+        "_gen_q_over_p",
+        "_selected_buses_ids",
+        "_headroom_tolerance_p_mw",
+        "_headroom_rel_tolerance",
+        "_solver_opts",
+        "_max_iterations",
+        "_normal_limits",
+        "_contingency_limits",
+        "_normal_limits_kwargs",
+        "_check_contingency_violations",
+        "_connection_scenario",
+        "_use_full_newton_raphson",
+        "_contingency_scenario",
+        "_load_mva_by_bus",
+        "_gen_mva_by_bus",
+    )
+
     def __init__(
         self,
         case_name: str,
@@ -116,31 +263,55 @@ class CapacityAnalyser:
         contingency_limits: Optional[ViolationsLimits],
         contingency_scenario: Optional[ContingencyScenario] = None,
         connection_scenario: Optional[ConnectionScenario] = None,
+        headroom_rel_tolerance: float = 0.0,
+        use_full_newton_raphson: Optional[bool] = None,
+        n_processes: int = 1,
     ):
         self._case_name: str = case_name
         wf.open_case(case_name)
         self._load_power_factor: float = load_power_factor
         self._gen_power_factor: float = gen_power_factor
-        self._upper_load_limit_mva: Final[complex] = p_to_mva(
-            upper_load_limit_p_mw, self._load_power_factor
-        )
-        self._upper_gen_limit_mva: Final[complex] = p_to_mva(
-            upper_gen_limit_p_mw, self._gen_power_factor
+        self._upper_load_limit_p_mw: Final[float] = upper_load_limit_p_mw
+        self._upper_gen_limit_p_mw: Final[float] = upper_gen_limit_p_mw
+        self._load_q_over_p: Final[float] = q_over_p(self._load_power_factor)
+        self._gen_q_over_p: Final[float] = q_over_p(self._gen_power_factor)
+        # Hashed for O(1) membership tests while iterating over all the buses
+        self._selected_buses_ids: Final[Optional[frozenset[int]]] = (
+            None if selected_buses_ids is None else frozenset(selected_buses_ids)
         )
-        self._selected_buses_ids: Optional[Collection[int]] = selected_buses_ids
         self._headroom_tolerance_p_mw: Final[float] = headroom_tolerance_p_mw
+        self._headroom_rel_tolerance: Final[float] = headroom_rel_tolerance
         self._solver_opts: Optional[dict] = solver_opts
         self._max_iterations: Final[int] = max_iterations
         self._normal_limits: Final[Optional[ViolationsLimits]] = normal_limits
         self._contingency_limits: Final[Optional[ViolationsLimits]] = contingency_limits
+        # Limits kwargs are built once: unset limits are an empty dict,
+        # so the checks don't branch on them for every probe
+        self._normal_limits_kwargs: Final[dict[str, Any]] = (
+            {} if normal_limits is None else dataclasses.asdict(normal_limits)
+        )
         self._connection_scenario: Optional[
             SortedConnectionScenario
         ] = sort_connection_scenario(connection_scenario)
-        self._use_full_newton_raphson: Final[bool] = not self.fdns_is_applicable()
+        if use_full_newton_raphson is None:
+            use_full_newton_raphson = not self.fdns_is_applicable()
+        else:
+            # The solver is already chosen for this case, the test solves are skipped
+            self.apply_connection_scenario()
+        self._use_full_newton_raphson: Final[bool] = use_full_newton_raphson
+        # Bound once, not converted from the limits for every probe
+        self._check_contingency_violations: Final[
+            Callable[[], Violations]
+        ] = get_contingency_violations_check(
+            contingency_limits, use_full_newton_raphson
+        )
         self.check_base_case_violations()
         self._contingency_scenario: Final[
             ContingencyScenario
-        ] = self.handle_empty_contingency_scenario(contingency_scenario)
+        ] = self.handle_empty_contingency_scenario(contingency_scenario, n_processes)
+        # Summed once to look up the buses in any order
+        self._load_mva_by_bus: Final[PowerByBus] = get_load_mva_by_bus()
+        self._gen_mva_by_bus: Final[PowerByBus] = self.base_case_gen_mva_by_bus()
 
     def fdns_is_applicable(self) -> bool:
         """Fixed slope Decoupled Newton-Raphson Solver (FDNS) is applicable"""
@@ -160,36 +331,7 @@ class CapacityAnalyser:
         self.apply_connection_scenario()
 
     def apply_connection_scenario(self) -> None:
-        if self._connection_scenario is None:
-            return
-        connections_iterator: Iterator = iter(self._connection_scenario.items())
-        connections_available: bool = True
-        bus_number = 0
-        connection = BusConnection(load=None)
-        try:
-            bus_number, connection = next(connections_iterator)
-        except StopIteration:
-            connections_available = False
-        for bus in Buses():
-            if connections_available and bus.number == bus_number:
-                if (
-                    load_connection := connection.load
-                ) is not None and load_connection.p_mw:
-                    bus.add_load(
-                        p_to_mva(load_connection.p_mw, load_connection.pf),
-                        "CR",
-                    )
-                if (
-                    gen_connection := connection.gen
-                ) is not None and gen_connection.p_mw:
-                    bus.add_gen(
-                        p_to_mva(gen_connection.p_mw, gen_connection.pf),
-                        "CR",
-                    )
-                try:
-                    bus_number, connection = next(connections_iterator)
-                except StopIteration:
-                    connections_available = False
+        apply_connection_scenario(self._connection_scenario)
 
     def check_base_case_violations(self) -> None:
         """Raise `RuntimeError` if base case has violations"""
@@ -201,97 +343,207 @@ class CapacityAnalyser:
         ViolationsStats.register_base_case_violations()
 
     def handle_empty_contingency_scenario(
-        self, contingency_scenario: Optional[ContingencyScenario]
+        self, contingency_scenario: Optional[ContingencyScenario], n_processes: int = 1
     ) -> ContingencyScenario:
-        """Returns new contingency scenario if none is provided"""
+        """Returns new contingency scenario if none is provided
+
+        The outages are solved by a pool of processes if `n_processes` is above one.
+        """
         if contingency_scenario is not None:
             return contingency_scenario
-        contingency_scenario = get_contingency_scenario(
-            use_full_newton_raphson=self._use_full_newton_raphson,
-            solver_opts=self._solver_opts,
-            contingency_limits=self._contingency_limits,
-        )
+        if n_processes > 1:
+            with multiprocessing.Pool(
+                n_processes,
+                initializer=init_case_worker,
+                initargs=(
+                    self._case_name,
+                    self._connection_scenario,
+                    ViolationsStats.base_case_violations_dict(),
+                ),
+            ) as pool:
+                contingency_scenario = get_contingency_scenario(
+                    use_full_newton_raphson=self._use_full_newton_raphson,
+                    solver_opts=self._solver_opts,
+                    contingency_limits=self._contingency_limits,
+                    pool=pool,
+                )
+        else:
+            contingency_scenario = get_contingency_scenario(
+                use_full_newton_raphson=self._use_full_newton_raphson,
+                solver_opts=self._solver_opts,
+                contingency_limits=self._contingency_limits,
+            )
         # Reopen file to fix potential solver problems after building contingency scenario
         self.reload_case()
         return contingency_scenario
 
-    def buses_headroom(self) -> Headroom:
-        """Return actual load and max additional PQ power in MVA for each bus"""
-        console.print("Analysing headroom", style="blue")
+    def base_case_gen_mva_by_bus(self) -> PowerByBus:
+        """Return the base case generation of the buses"""
+        if sys.platform != "win32" or envs.pandapower_backend:
+            # The dynamic generators data is valid only after converged PandaPower solution
+            if not wf.is_converged():
+                run_solver(
+                    use_full_newton_raphson=self._use_full_newton_raphson,
+                    solver_opts=self._solver_opts,
+                )
+        return get_gen_mva_by_bus()
+
+    def buses_headroom(self, verbose: bool = True, n_processes: int = 1) -> Headroom:
+        """Return actual load and max additional PQ power in MVA for each bus
+
+        The progress is only shown if `verbose`.
+        The buses are analysed in parallel if `n_processes` is above one.
+        """
+        generate, total = self.create_buses_headroom_generator(n_processes)
+        headroom: Headroom = Headroom(total)
+        if not verbose:
+            for bus_headroom, _ in generate():
+                headroom.append(bus_headroom)
+            return headroom
 
-        generate, total = self.create_buses_headroom_generator()
-        headroom: list[BusHeadroom] = []
+        # Imported here to not slow down the module import for library users
+        from tqdm import tqdm
+
+        console.print("Analysing headroom", style="blue")
+        # Redraw the progress bar about 200 times per analysis at most:
+        # every redraw is a synchronous write to the terminal.
+        update_interval: int = max(1, total // 200)
 
         with tqdm(
-            total=total
-            if self._selected_buses_ids is None
-            else len(self._selected_buses_ids),
-            postfix=[{}],
+            total=total,
+            miniters=update_interval,
+            mininterval=0.5,
         ) as progress:
-            for bus_headroom, _ in generate():
-                progress.postfix[0]["bus_number"] = bus_headroom.bus.number
-                progress.postfix[0]["power_flows"] = PowerFlows.count
-                progress.update()
+            buses_since_update: int = 0
+            for bus_headroom, power_flows_count in generate():
                 headroom.append(bus_headroom)
+                buses_since_update += 1
+                if buses_since_update == update_interval:
+                    # The postfix is only drawn by the next update
+                    progress.set_postfix_str(
+                        f"bus_number={bus_headroom.bus.number}, "
+                        f"power_flows={power_flows_count}",
+                        refresh=False,
+                    )
+                    progress.update(buses_since_update)
+                    buses_since_update = 0
+            if buses_since_update:
+                progress.update(buses_since_update)
 
         return headroom
 
-    def create_buses_headroom_generator(self):
+    def create_buses_headroom_generator(self, n_processes: int = 1):
+        if n_processes > 1:
+            return self.create_parallel_buses_headroom_generator(n_processes)
+        selected_buses: list[Bus] = self.selected_buses()
+        PowerFlows.reset_count()
+        ViolationsStats.reset()
+
+        def generate() -> Generator[tuple[BusHeadroom, Any], Any, None]:
+            for bus in selected_buses:
+                yield self.bus_headroom(bus), PowerFlows.count
+
+        return generate, len(selected_buses)
+
+    def selected_buses(self) -> list[Bus]:
+        """Return the buses to analyse, filtered once before the analysis
+
+        The list length is exactly the number of analysed buses,
+        even if some selected buses ids are not in the case.
+        """
         buses: Buses = Buses()
-        total = (
-            len(buses)
-            if self._selected_buses_ids is None
-            else len(self._selected_buses_ids)
-        )
+        if self._selected_buses_ids is None:
+            return list(buses)
+        return [bus for bus in buses if bus.number in self._selected_buses_ids]
+
+    def create_parallel_buses_headroom_generator(self, n_processes: int):
+        """Analyse the buses by a pool of processes with own case copies
+
+        The buses are sent to the workers in contiguous chunks
+        and the results are yielded in the buses order.
+        The stats collected by the workers are merged into this process stats.
+        """
+        selected_buses: list[Bus] = self.selected_buses()
+        chunksize: int = max(1, len(selected_buses) // (n_processes * 4))
         PowerFlows.reset_count()
         ViolationsStats.reset()
 
         def generate() -> Generator[tuple[BusHeadroom, Any], Any, None]:
-            for bus in buses:
-                if (
-                    self._selected_buses_ids is None
-                    or bus.number in self._selected_buses_ids
+            with multiprocessing.Pool(
+                n_processes,
+                initializer=init_headroom_worker,
+                initargs=(
+                    self.worker_args(),
+                    ViolationsStats.base_case_violations_dict(),
+                ),
+            ) as pool:
+                for bus_headroom, worker_stats in pool.imap(
+                    worker_bus_headroom, selected_buses, chunksize
                 ):
-                    yield self.bus_headroom(bus), PowerFlows.count
-
-        return generate, total
+                    PowerFlows.add_count(worker_stats.power_flows_count)
+                    ViolationsStats.merge(worker_stats.violations_stats)
+                    CapacityAnalysisStats.merge(
+                        worker_stats.feasibility_stats,
+                        worker_stats.contingency_stats,
+                    )
+                    yield bus_headroom, PowerFlows.count
+
+        return generate, len(selected_buses)
+
+    def worker_args(self) -> tuple:
+        """Return arguments to create the same analyser in a worker process
+
+        The contingency scenario and the solver choice are passed
+        to not build and test them again in every worker.
+        """
+        return (
+            self._case_name,
+            self._upper_load_limit_p_mw,
+            self._upper_gen_limit_p_mw,
+            self._load_power_factor,
+            self._gen_power_factor,
+            None,
+            self._headroom_tolerance_p_mw,
+            self._solver_opts,
+            self._max_iterations,
+            self._normal_limits,
+            self._contingency_limits,
+            self._contingency_scenario,
+            self._connection_scenario,
+            self._headroom_rel_tolerance,
+            self._use_full_newton_raphson,
+        )
 
     def bus_headroom(self, bus: Bus) -> BusHeadroom:
         """Return bus actual load and max additional PQ power in MVA"""
         if sys.platform != "win32" or envs.pandapower_backend:
-            # The dynamic generators data is valid only after converged PandaPower solution
+            # Start the bus analysis from a converged PandaPower solution
             if not wf.is_converged():
                 run_solver(
                     use_full_newton_raphson=self._use_full_newton_raphson,
                     solver_opts=self._solver_opts,
                 )
-        actual_load_mva: complex = bus.load_mva()
-        actual_gen_mva: complex = bus.gen_mva()
+        power_flows_count: int = PowerFlows.count
+        actual_load_mva: complex = self._load_mva_by_bus.get(bus.number, 0j)
+        actual_gen_mva: complex = self._gen_mva_by_bus.get(bus.number, 0j)
+        # A non-converged case doesn't need a reload here:
+        # the search reloads the case after every infeasible point.
         load_lf: Optional[LimitingFactor]
         load_available_mva: complex
         temp_load: TemporaryBusLoad = TemporaryBusLoad(bus)
         load_available_mva, load_lf = self.max_power_available_mva(
-            temp_load, self._upper_load_limit_mva
+            temp_load, self._upper_load_limit_p_mw, self._load_q_over_p
         )
-        if (
-            load_available_mva == 0j
-            and load_lf is not None
-            and load_lf.v == Violations.NOT_CONVERGED
-        ):
-            self.reload_case()
         gen_available_mva: complex = 0j
         gen_lf: Optional[LimitingFactor] = None
         if actual_gen_mva != 0 and load_available_mva != 0j:
             temp_gen: TemporaryBusMachine = TemporaryBusMachine(bus)
             gen_available_mva, gen_lf = self.max_power_available_mva(
-                temp_gen, self._upper_gen_limit_mva
+                temp_gen, self._upper_gen_limit_p_mw, self._gen_q_over_p
             )
-            if (
-                gen_available_mva == 0j
-                and gen_lf is not None
-                and gen_lf.v == Violations.NOT_CONVERGED
-            ):
-                self.reload_case()
+        log.debug(
+            "%s headroom took %d power flows", bus, PowerFlows.count - power_flows_count
+        )
         return BusHeadroom(
             bus=bus,
             actual_load_mva=actual_load_mva,
@@ -305,79 +557,109 @@ class CapacityAnalyser:
     def max_power_available_mva(
         self,
         temp_subsystem: TemporaryBusSubsystem,
-        upper_limit_mva: complex,
+        upper_limit_p_mw: float,
+        q_over_p: float,
     ) -> tuple[complex, Optional[LimitingFactor]]:
-        """Return max additional PQ power in MVA and a limiting factor"""
-        lower_limit_mva: complex = 0j
+        """Return max additional PQ power in MVA and a limiting factor
+
+        The zero additional power is feasible by construction:
+        the base case is checked by `check_base_case_violations`,
+        and its violations are excluded from the analysis.
+        So the lower limit is never solved, only the upper limit and the middle points.
+
+        The search runs on real and reactive power floats,
+        the complex power is only built for the temporary subsystem.
+        """
+        if upper_limit_p_mw == 0.0:
+            # Nothing to solve: the zero additional power is feasible
+            return 0j, None
+        lower_limit_p_mw: float = 0.0
+        lower_limit_q_mvar: float = 0.0
+        upper_limit_q_mvar: float = upper_limit_p_mw * q_over_p
+        middle_p_mw: float
+        middle_q_mvar: float
+        # The last feasible solution is a good initial guess for the next middle point.
+        # PandaPower restores it after a case reload from a copy of the bus results.
+        # PSSE would need a `bus_chng_4` call per bus, so it starts from the case.
+        # Another bus may be far from it.
+        warm_start: bool = False
+        feasible_bus_voltages: Optional[Any] = None
         is_feasible: bool
         limiting_factor: Optional[LimitingFactor]
-        # If upper limit is available, return it immediately
-        with temp_subsystem(upper_limit_mva):
+        # The temporary subsystem is added once and its power is changed in place
+        # for every middle point, unless the case was reloaded after a failed check.
+        with temp_subsystem(complex(upper_limit_p_mw, upper_limit_q_mvar)):
             is_feasible, limiting_factor = self.feasibility_check()
-        if is_feasible:
-            return upper_limit_mva, limiting_factor
-        CapacityAnalysisStats.update(temp_subsystem, limiting_factor)
-        self.reload_case()
-        # First iteration was initial upper limit check. Subtract it.
-        for _ in range(self._max_iterations - 1):
-            middle_mva: complex = (lower_limit_mva + upper_limit_mva) / 2
-            with temp_subsystem(middle_mva):
-                is_feasible, limiting_factor = self.feasibility_check()
+            # If upper limit is available, return it immediately
             if is_feasible:
-                # Middle point is feasible: headroom is above
-                lower_limit_mva = middle_mva
-            else:
-                # Middle point is NOT feasible: headroom is below
-                upper_limit_mva = middle_mva
-                CapacityAnalysisStats.update(temp_subsystem, limiting_factor)
-                self.reload_case()
-            if (
-                upper_limit_mva.real - lower_limit_mva.real
-                < self._headroom_tolerance_p_mw
-            ):
-                break
-        return lower_limit_mva, limiting_factor
-
-    def feasibility_check(self) -> tuple[bool, Optional[LimitingFactor]]:
-        """Return `True` if feasible, else `False` with limiting factor"""
+                return complex(upper_limit_p_mw, upper_limit_q_mvar), limiting_factor
+            CapacityAnalysisStats.update(temp_subsystem, limiting_factor)
+            self.reload_case()
+            temp_subsystem.mark_purged()
+            # First iteration was initial upper limit check. Subtract it.
+            for _ in range(self._max_iterations - 1):
+                # Check tolerance before solving the middle point,
+                # so an upper limit below the tolerance isn't bisected at all.
+                # The relative tolerance stops earlier on large headrooms.
+                if upper_limit_p_mw - lower_limit_p_mw < max(
+                    self._headroom_tolerance_p_mw,
+                    self._headroom_rel_tolerance * upper_limit_p_mw,
+                ):
+                    break
+                # Bisect reactive power on its own rather than scaling the real one
+                # to keep the exact values of the complex power bisection
+                middle_p_mw = (lower_limit_p_mw + upper_limit_p_mw) / 2
+                middle_q_mvar = (lower_limit_q_mvar + upper_limit_q_mvar) / 2
+                temp_subsystem.set_power(complex(middle_p_mw, middle_q_mvar))
+                is_feasible, limiting_factor = self.feasibility_check(warm_start)
+                if is_feasible:
+                    # Middle point is feasible: headroom is above
+                    lower_limit_p_mw = middle_p_mw
+                    lower_limit_q_mvar = middle_q_mvar
+                    if sys.platform != "win32" or envs.pandapower_backend:
+                        feasible_bus_voltages = wf.get_bus_voltages()
+                else:
+                    # Middle point is NOT feasible: headroom is below
+                    upper_limit_p_mw = middle_p_mw
+                    upper_limit_q_mvar = middle_q_mvar
+                    CapacityAnalysisStats.update(temp_subsystem, limiting_factor)
+                    self.reload_case()
+                    temp_subsystem.mark_purged()
+                    if feasible_bus_voltages is not None:
+                        wf.set_bus_voltages(feasible_bus_voltages)
+                warm_start = is_feasible or feasible_bus_voltages is not None
+        return complex(lower_limit_p_mw, lower_limit_q_mvar), limiting_factor
+
+    def feasibility_check(
+        self, warm_start: bool = False
+    ) -> tuple[bool, Optional[LimitingFactor]]:
+        """Return `True` if feasible, else `False` with limiting factor
+
+        With `warm_start` the base case is solved starting from the previous solution.
+        """
         violations: Violations
         limiting_factor: Optional[LimitingFactor]
-        if (violations := self.check_violations()) != Violations.NO_VIOLATIONS:
+        if (
+            violations := self.check_violations(warm_start)
+        ) != Violations.NO_VIOLATIONS:
             return False, LimitingFactor(violations, None)
         limiting_factor = self.contingency_check()
         if limiting_factor.v != Violations.NO_VIOLATIONS:
             return False, limiting_factor
         return True, None
 
-    def check_violations(self) -> Violations:
-        violations: Violations
-        if self._normal_limits is None:
-            violations = check_violations(
-                use_full_newton_raphson=self._use_full_newton_raphson,
-                solver_opts=self._solver_opts,
-            )
-        else:
-            violations = check_violations(
-                **dataclasses.asdict(self._normal_limits),
-                use_full_newton_raphson=self._use_full_newton_raphson,
-                solver_opts=self._solver_opts,
-            )
-        return violations
+    def check_violations(self, warm_start: bool = False) -> Violations:
+        return check_violations(
+            **self._normal_limits_kwargs,
+            use_full_newton_raphson=self._use_full_newton_raphson,
+            solver_opts=self._solver_opts,
+            warm_start=warm_start,
+        )
 
     def contingency_check(self) -> LimitingFactor:
-        limiting_factor: LimitingFactor
-        if self._contingency_limits is None:
-            limiting_factor = get_contingency_limiting_factor(
-                contingency_scenario=self._contingency_scenario,
-                use_full_newton_raphson=self._use_full_newton_raphson,
-            )
-        else:
-            limiting_factor = get_contingency_limiting_factor(
-                contingency_scenario=self._contingency_scenario,
-                use_full_newton_raphson=self._use_full_newton_raphson,
-                contingency_limits=self._contingency_limits,
-            )
-        return limiting_factor
+        return get_first_contingency_limiting_factor(
+            self._contingency_scenario, self._check_contingency_violations
+        )
 
 
 class CapacityAnalysisStats:
@@ -418,6 +700,37 @@ class CapacityAnalysisStats:
     def contingencies_dict(cls) -> dict:
         return cls._contingency_stats
 
+    @classmethod
+    def pop(
+        cls,
+    ) -> tuple[
+        dict[Bus, list[UnfeasibleCondition]],
+        dict[LimitingSubsystem, BusToContingencyConditions],
+    ]:
+        """Return the stats as plain dicts, that can be pickled, and reset them"""
+        feasibility_stats: dict[Bus, list[UnfeasibleCondition]] = dict(
+            cls._feasibility_stats
+        )
+        contingency_stats: dict[LimitingSubsystem, BusToContingencyConditions] = {
+            subsystem: dict(bus_to_conditions)
+            for subsystem, bus_to_conditions in cls._contingency_stats.items()
+        }
+        cls.reset()
+        return feasibility_stats, contingency_stats
+
+    @classmethod
+    def merge(
+        cls,
+        feasibility_stats: dict[Bus, list[UnfeasibleCondition]],
+        contingency_stats: dict[LimitingSubsystem, BusToContingencyConditions],
+    ) -> None:
+        """Add the stats collected by another process"""
+        for bus, unfeasible_conditions in feasibility_stats.items():
+            cls._feasibility_stats[bus].extend(unfeasible_conditions)
+        for subsystem, bus_to_conditions in contingency_stats.items():
+            for bus, contingency_conditions in bus_to_conditions.items():
+                cls._contingency_stats[subsystem][bus].extend(contingency_conditions)
+
     @classmethod
     def feasibility_dict(cls) -> dict:
         return cls._feasibility_stats
@@ -431,17 +744,27 @@ class CapacityAnalysisStats:
                 console.print(unfeasible_conditions)
         if len(cls._contingency_stats.keys()):
             console.rule("CONTINGENCIES STATS")
-            for contingency, bus_to_contingency_conditions in sorted(
-                cls._contingency_stats.items(),
-                key=lambda items: sum(
-                    len(contingency_conditions)
-                    for contingency_conditions in items[1].values()
-                ),
-                reverse=True,
-            ):
-                console.print(
-                    f"{contingency=}[{sum(len(violations) for violations in bus_to_contingency_conditions.values())}]:"
+            # Count the conditions once: for sorting and for printing
+            counted_contingency_stats: list[
+                tuple[LimitingSubsystem, int, BusToContingencyConditions]
+            ] = [
+                (
+                    contingency,
+                    sum(
+                        len(contingency_conditions)
+                        for contingency_conditions in bus_to_conditions.values()
+                    ),
+                    bus_to_conditions,
                 )
+                for contingency, bus_to_conditions in cls._contingency_stats.items()
+            ]
+            counted_contingency_stats.sort(key=itemgetter(1), reverse=True)
+            for (
+                contingency,
+                conditions_count,
+                bus_to_contingency_conditions,
+            ) in counted_contingency_stats:
+                console.print(f"{contingency=}[{conditions_count}]:")
                 console.print(dict(bus_to_contingency_conditions))
 
     @classmethod
@@ -450,6 +773,100 @@ class CapacityAnalysisStats:
         cls._contingency_stats = defaultdict(bus_to_contingency_conditions)
 
 
+@dataclass(frozen=True)
+class HeadroomWorkerStats:
+    """Stats collected by a worker process during a bus analysis"""
+
+    power_flows_count: int
+    violations_stats: ViolationTypeToLimitValue
+    feasibility_stats: dict[Bus, list[UnfeasibleCondition]]
+    contingency_stats: dict[LimitingSubsystem, BusToContingencyConditions]
+
+
+def apply_connection_scenario(
+    connection_scenario: Optional[SortedConnectionScenario],
+) -> None:
+    """Add the connection scenario loads and generators to the open case"""
+    if connection_scenario is None:
+        return
+    connections_iterator: Iterator = iter(connection_scenario.items())
+    connections_available: bool = True
+    bus_number = 0
+    connection = BusConnection(load=None)
+    try:
+        bus_number, connection = next(connections_iterator)
+    except StopIteration:
+        connections_available = False
+    for bus in Buses():
+        if connections_available and bus.number == bus_number:
+            if (
+                load_connection := connection.load
+            ) is not None and load_connection.p_mw:
+                bus.add_load(
+                    p_to_mva(load_connection.p_mw, load_connection.pf),
+                    "CR",
+                )
+            if (gen_connection := connection.gen) is not None and gen_connection.p_mw:
+                bus.add_gen(
+                    p_to_mva(gen_connection.p_mw, gen_connection.pf),
+                    "CR",
+                )
+            try:
+                bus_number, connection = next(connections_iterator)
+            except StopIteration:
+                connections_available = False
+
+
+def init_case_worker(
+    case_name: str,
+    connection_scenario: Optional[SortedConnectionScenario],
+    base_case_violations: ViolationTypeToSubsystemIdx,
+) -> None:
+    """Open the case with the connection scenario in a worker process
+
+    The base case violations of the parent process are registered,
+    so the outages are screened for the new violations only.
+    """
+    wf.open_case(case_name)
+    apply_connection_scenario(connection_scenario)
+    ViolationsStats.set_base_case_violations(base_case_violations)
+
+
+# The analyser of a worker process, created by `init_headroom_worker`
+_worker_capacity_analyser: Optional[CapacityAnalyser] = None
+
+
+def init_headroom_worker(
+    capacity_analyser_args: tuple, base_case_violations: ViolationTypeToSubsystemIdx
+) -> None:
+    """Open the case in a worker process
+
+    The base case violations registered by the worker analyser are replaced
+    with the ones of the parent process. A forked worker inherits them,
+    so its own check would exclude them and register none.
+    """
+    global _worker_capacity_analyser
+    _worker_capacity_analyser = CapacityAnalyser(*capacity_analyser_args)
+    ViolationsStats.set_base_case_violations(base_case_violations)
+
+
+def worker_bus_headroom(bus: Bus) -> tuple[BusHeadroom, HeadroomWorkerStats]:
+    """Return the bus headroom and the stats collected during its analysis"""
+    if _worker_capacity_analyser is None:
+        raise RuntimeError("The headroom worker is not initialized")
+    PowerFlows.reset_count()
+    ViolationsStats.reset()
+    CapacityAnalysisStats.reset()
+    bus_headroom: BusHeadroom = _worker_capacity_analyser.bus_headroom(bus)
+    feasibility_stats, contingency_stats = CapacityAnalysisStats.pop()
+    return bus_headroom, HeadroomWorkerStats(
+        power_flows_count=PowerFlows.count,
+        violations_stats=ViolationsStats.pop(),
+        feasibility_stats=feasibility_stats,
+        contingency_stats=contingency_stats,
+    )
+
+
 def sort_connection_scenario(
     connection_scenario: Optional[ConnectionScenario],
 ) -> Optional[SortedConnectionScenario]:
@@ -499,8 +916,19 @@ def buses_headroom(
     contingency_limits: Optional[ViolationsLimits] = None,
     contingency_scenario: Optional[ContingencyScenario] = None,
     connection_scenario: Optional[ConnectionScenario] = None,
+    verbose: bool = True,
+    n_processes: int = 1,
+    headroom_rel_tolerance: float = 0.0,
 ) -> Headroom:
-    """Return actual load and max additional PQ power in MVA for each bus."""
+    """Return actual load and max additional PQ power in MVA for each bus.
+
+    The analysis progress is only shown if `verbose`.
+    With `n_processes` above one the buses are analysed by a pool of processes,
+    each with its own copy of the case. So are the contingencies screened
+    if no `contingency_scenario` is given.
+    The headroom search stops when the power range is below
+    `headroom_tolerance_p_mw` or `headroom_rel_tolerance` of its upper limit.
+    """
     capacity_analyser: CapacityAnalyser = CapacityAnalyser(
         case_name,
         upper_load_limit_p_mw,
@@ -515,5 +943,7 @@ def buses_headroom(
         contingency_limits,
         contingency_scenario,
         connection_scenario,
+        headroom_rel_tolerance,
+        n_processes=n_processes,
     )
-    return capacity_analyser.buses_headroom()
+    return capacity_analyser.buses_headroom(verbose, n_processes)
@@ -69,6 +69,8 @@ class ConfigModel(BaseModel):
     )
     contingency_scenario: Optional[ContingencyScenario]
     connection_scenario: Optional[ConnectionScenario]
+    n_processes: PositiveInt = 1
+    headroom_rel_tolerance: NonNegativeFloat = 0.0
 
 
 def load_config_model(config_file_name: str) -> ConfigModel:
@@ -82,4 +84,5 @@ def load_config_model(config_file_name: str) -> ConfigModel:
         if probably_absolute_path.is_absolute()
         else Path(__file__).absolute().parents[1] / config_file_name
     )
-    return ConfigModel(**json.load(config_file_path.open(encoding="utf-8")))
+    # The file is read and closed at once, `json` decodes UTF-8 bytes itself
+    return ConfigModel(**json.loads(config_file_path.read_bytes()))
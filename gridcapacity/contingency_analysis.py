@@ -14,12 +14,17 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import dataclasses
+import functools
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Optional, Union
+from itertools import compress
+from multiprocessing.pool import Pool
+from typing import Any, Optional, Union
 
 from gridcapacity.backends.subsystems import Branches, Trafos
 from gridcapacity.backends.subsystems.branch import Branch, disable_branch
 from gridcapacity.backends.subsystems.trafo import Trafo, disable_trafo
+from gridcapacity.utils import DATACLASS_SLOTS
 from gridcapacity.violations_analysis import (
     Violations,
     ViolationsLimits,
@@ -36,7 +41,7 @@ class ContingencyScenario:
 LimitingSubsystem = Union[None, Branch, Trafo]
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class LimitingFactor:
     v: Violations
     ss: LimitingSubsystem = None
@@ -55,28 +60,51 @@ def get_contingency_limiting_factor(
     ),
     use_full_newton_raphson: bool = False,
 ) -> LimitingFactor:
+    """Return the limiting factor of the first violating contingency"""
+    return get_first_contingency_limiting_factor(
+        contingency_scenario,
+        get_contingency_violations_check(contingency_limits, use_full_newton_raphson),
+    )
+
+
+def get_contingency_violations_check(
+    contingency_limits: Optional[ViolationsLimits], use_full_newton_raphson: bool
+) -> Callable[[], Violations]:
+    """Return the violations check with the contingency limits bound
+
+    The default contingency limits are used if `contingency_limits` isn't given.
+    """
+    return functools.partial(
+        check_violations,
+        **dataclasses.asdict(contingency_limits or get_default_contingency_limits()),
+        use_full_newton_raphson=use_full_newton_raphson,
+    )
+
+
+def get_first_contingency_limiting_factor(
+    contingency_scenario: ContingencyScenario,
+    check_contingency_violations: Callable[[], Violations],
+) -> LimitingFactor:
+    """Return the limiting factor of the first contingency the check violates"""
+    # Every check returns at the first violating contingency,
+    # so there are no violations to accumulate across the contingencies
     violations: Violations = Violations.NO_VIOLATIONS
     for branch in contingency_scenario.branches:
         if branch.is_enabled():
             with disable_branch(branch):
-                violations |= check_violations(
-                    **dataclasses.asdict(contingency_limits),
-                    use_full_newton_raphson=use_full_newton_raphson,
-                )
+                violations = check_contingency_violations()
                 if violations != Violations.NO_VIOLATIONS:
                     return LimitingFactor(violations, branch)
     for trafo in contingency_scenario.trafos:
         if trafo.is_enabled():
             with disable_trafo(trafo):
-                violations |= check_violations(
-                    **dataclasses.asdict(contingency_limits),
-                    use_full_newton_raphson=use_full_newton_raphson,
-                )
+                violations = check_contingency_violations()
                 if violations != Violations.NO_VIOLATIONS:
                     return LimitingFactor(violations, trafo)
     return LimitingFactor(violations, None)
 
 
+@functools.cache
 def get_default_contingency_limits() -> ViolationsLimits:
     if (
         tuple(get_contingency_limiting_factor.__annotations__.keys())[1]
@@ -95,44 +123,64 @@ def get_default_contingency_limits() -> ViolationsLimits:
     return contingency_limiting_factor_defaults[0]
 
 
+def branch_is_not_critical(branch: Branch, **check_violations_kwargs: Any) -> bool:
+    """Return `True` if the branch outage doesn't violate the limits"""
+    if branch.is_enabled():
+        with disable_branch(branch) as is_disabled:
+            if is_disabled:
+                violations: Violations = check_violations(**check_violations_kwargs)
+                return violations == Violations.NO_VIOLATIONS
+    return False
+
+
+def trafo_is_not_critical(trafo: Trafo, **check_violations_kwargs: Any) -> bool:
+    """Return `True` if the trafo outage doesn't violate the limits"""
+    if trafo.is_enabled():
+        with disable_trafo(trafo) as is_disabled:
+            if is_disabled:
+                violations: Violations = check_violations(**check_violations_kwargs)
+                return violations == Violations.NO_VIOLATIONS
+    return False
+
+
 def get_contingency_scenario(
     use_full_newton_raphson: bool,
     solver_opts: Optional[dict],
-    contingency_limits: Optional[ViolationsLimits] = get_default_contingency_limits(),
+    contingency_limits: Optional[ViolationsLimits] = None,
+    pool: Optional[Pool] = None,
 ) -> ContingencyScenario:
-    contingency_limits = contingency_limits or get_default_contingency_limits()
-
-    def check_contingency_limits_violations() -> Violations:
-        return check_violations(
-            **dataclasses.asdict(contingency_limits),
-            use_full_newton_raphson=use_full_newton_raphson,
-            solver_opts=solver_opts,
-        )
-
-    def branch_is_not_critical(
-        branch: Branch,
-    ) -> bool:
-        if branch.is_enabled():
-            with disable_branch(branch) as is_disabled:
-                if is_disabled:
-                    violations: Violations = check_contingency_limits_violations()
-                    return violations == Violations.NO_VIOLATIONS
-        return False
-
-    def trafo_is_not_critical(
-        trafo: Trafo,
-    ) -> bool:
-        if trafo.is_enabled():
-            with disable_trafo(trafo) as is_disabled:
-                if is_disabled:
-                    violations: Violations = check_contingency_limits_violations()
-                    return violations == Violations.NO_VIOLATIONS
-        return False
+    """Return the branches and trafos which outages don't violate the limits
 
+    The outages are solved by the `pool` worker processes if it's given.
+    Every worker should have the same case opened
+    and the same base case violations registered.
+    The default contingency limits are used if `contingency_limits` isn't given.
+    """
+    contingency_limits = contingency_limits or get_default_contingency_limits()
+    check_violations_kwargs: dict[str, Any] = dict(
+        dataclasses.asdict(contingency_limits),
+        use_full_newton_raphson=use_full_newton_raphson,
+        solver_opts=solver_opts,
+    )
+    map_outages = map if pool is None else pool.map
+    branches: tuple[Branch, ...] = tuple(Branches())
+    trafos: tuple[Trafo, ...] = tuple(Trafos())
     not_critical_branches: tuple[Branch, ...] = tuple(
-        branch for branch in Branches() if branch_is_not_critical(branch)
+        compress(
+            branches,
+            map_outages(
+                functools.partial(branch_is_not_critical, **check_violations_kwargs),
+                branches,
+            ),
+        )
     )
     not_critical_trafos: tuple[Trafo, ...] = tuple(
-        trafo for trafo in Trafos() if trafo_is_not_critical(trafo)
+        compress(
+            trafos,
+            map_outages(
+                functools.partial(trafo_is_not_critical, **check_violations_kwargs),
+                trafos,
+            ),
+        )
     )
     return ContingencyScenario(not_critical_branches, not_critical_trafos)
@@ -3,6 +3,7 @@ from pydantic import BaseSettings
 
 class Envs(BaseSettings):
     pandapower_backend: bool = False
+    lightsim2grid: bool = False
     treat_violations_as_warnings: bool = False
     verbose: bool = False
 
@@ -15,8 +15,10 @@ limitations under the License.
 """
 import dataclasses
 import json
+import textwrap
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 import numpy as np
 import rich
@@ -32,6 +34,14 @@ from gridcapacity.backends.subsystems import (
 from gridcapacity.capacity_analysis import CapacityAnalysisStats, Headroom
 from gridcapacity.violations_analysis import Violations, ViolationsStats
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Relative case outputs are written to the repository root
+REPOSITORY_ROOT: Final[Path] = Path(__file__).absolute().parents[1]
+
 
 def write_headroom_output(case_name: str, headroom: Headroom) -> None:
     case_path: Path = Path(case_name)
@@ -47,44 +57,46 @@ def write_headroom_output(case_name: str, headroom: Headroom) -> None:
     feasibility_stats_output: Path = output_folder / (
         f"{output_file_prefix}_feasibility_stats.json"
     )
-    json.dump(
-        {"headroom": headroom},
-        headroom_output.open("w", encoding="utf-8"),
-        **json_dump_kwargs,
-    )
-    json.dump(
-        {str(k): v for k, v in ViolationsStats.asdict().items()},
-        violation_stats_output.open("w", encoding="utf-8"),
-        **json_dump_kwargs,
-    )
-    json.dump(
-        {
-            "contingency_stats": tuple(
-                {
-                    "contingency": contingency,
-                    "bus_contingency_conditions": tuple(
-                        {"b": bus, "cc": contingency_condition}
-                        for bus, contingency_condition in bus_to_contingency_conditions.items()
-                    ),
+    write_json_records("headroom", headroom, headroom_output)
+    violation_stats_output.write_text(
+        dumps_json(
+            {
+                # `orjson` would write the float limits with exponents differently
+                str(violation): {
+                    str(limit): ss_violations
+                    for limit, ss_violations in limit_value_to_ss_violations.items()
                 }
-                for contingency, bus_to_contingency_conditions in CapacityAnalysisStats.contingencies_dict().items()
-            )
-        },
-        contingency_stats_output.open("w", encoding="utf-8"),
-        **json_dump_kwargs,
+                for violation, limit_value_to_ss_violations in (
+                    ViolationsStats.asdict().items()
+                )
+            }
+        ),
+        encoding="utf-8",
     )
-    json.dump(
-        {
-            "feasibility_stats": tuple(
-                {
-                    "bus": bus,
-                    "unfeasible_conditions": unfeasible_conditions,
-                }
-                for bus, unfeasible_conditions in CapacityAnalysisStats.feasibility_dict().items()
-            )
-        },
-        feasibility_stats_output.open("w", encoding="utf-8"),
-        **json_dump_kwargs,
+    write_json_records(
+        "contingency_stats",
+        (
+            {
+                "contingency": contingency,
+                "bus_contingency_conditions": tuple(
+                    {"b": bus, "cc": contingency_condition}
+                    for bus, contingency_condition in bus_to_contingency_conditions.items()
+                ),
+            }
+            for contingency, bus_to_contingency_conditions in CapacityAnalysisStats.contingencies_dict().items()
+        ),
+        contingency_stats_output,
+    )
+    write_json_records(
+        "feasibility_stats",
+        (
+            {
+                "bus": bus,
+                "unfeasible_conditions": unfeasible_conditions,
+            }
+            for bus, unfeasible_conditions in CapacityAnalysisStats.feasibility_dict().items()
+        ),
+        feasibility_stats_output,
     )
     rich.print(f'Headroom was written to "{headroom_output}"')
 
@@ -106,19 +118,46 @@ def write_exported_data(case_name: str, exported_data: ExportedData) -> None:
     exported_data_path: Path = (
         output_folder / f"{output_file_prefix}_exported_data.json"
     )
-    json.dump(
-        exported_data,
-        exported_data_path.open("w", encoding="utf-8"),
-        **json_dump_kwargs,
-    )
+    exported_data_path.write_text(dumps_json(exported_data), encoding="utf-8")
     rich.print(f'Exported data was written to "{exported_data_path}"')
 
 
+def write_json_records(key: str, records: Iterable[Any], output: Path) -> None:
+    """Write `{key: [records]}` JSON serializing one record at a time
+
+    The output is the same as `json.dump` writes, without building the records list.
+    """
+    # The records are written in small pieces: buffer them to write large blocks
+    with output.open("w", encoding="utf-8", buffering=1 << 20) as output_file:
+        output_file.write(f'{{\n  "{key}": [')
+        separator: str = "\n"
+        for record in records:
+            output_file.write(separator)
+            # The records are items of a list in a dict: two indentation levels deeper
+            output_file.write(textwrap.indent(dumps_json(record), "    "))
+            separator = ",\n"
+        output_file.write("]\n}" if separator == "\n" else "\n  ]\n}")
+
+
 def get_output_folder(case_path: Path) -> Path:
     if case_path.is_absolute():
         return case_path.parent
     else:
-        return Path(__file__).absolute().parents[1]
+        return REPOSITORY_ROOT
+
+
+def dumps_json(obj: Any) -> str:
+    """Return indented JSON, serialized by `orjson` if it's installed
+
+    The `orjson` output is the same as the `json` one, except that it doesn't escape
+    non-ASCII characters and writes float exponents without a sign or zero padding,
+    also in float dict keys.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson_options, default=json_encode_helper
+        ).decode()
+    return json.dumps(obj, **json_dump_kwargs)
 
 
 def json_encode_helper(obj: Any) -> Any:
@@ -127,7 +166,15 @@ def json_encode_helper(obj: Any) -> Any:
     if isinstance(obj, Violations):
         return str(obj)
     if dataclasses.is_dataclass(obj):
-        return dataclasses.asdict(obj)
+        # Shallow: the encoder converts the nested values itself,
+        # `dataclasses.asdict` would deep copy them first.
+        # `orjson` writes enums as their values without calling this helper,
+        # so the violations are converted here.
+        return {
+            field.name: str(value) if isinstance(value, Violations) else value
+            for field in dataclasses.fields(obj)
+            for value in (getattr(obj, field.name),)
+        }
 
     if isinstance(obj, np.integer):
         return int(obj)
@@ -143,3 +190,10 @@ json_dump_kwargs: dict = {
     "indent": 2,
     "default": json_encode_helper,
 }
+# The stats have numeric keys, which `json` converts to strings.
+# The dataclasses are passed to `json_encode_helper`, which converts their violations.
+orjson_options: int = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
@@ -15,9 +15,21 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import math
+import sys
+from typing import Final
+
+# Frozen dataclasses with slots are picklable, as needed by the worker processes,
+# since Python 3.11
+DATACLASS_SLOTS: Final[dict[str, bool]] = (
+    {"slots": True} if sys.version_info >= (3, 11) else {}
+)
+
+
+def q_over_p(power_factor: float) -> float:
+    """Return reactive to real power ratio for the power factor."""
+    return math.tan(math.acos(power_factor))
 
 
 def p_to_mva(p: float, power_factor: float) -> complex:
     """Convert real power to complex MVA value using power factor."""
-    q = p * math.tan(math.acos(power_factor))
-    return p + 1j * q
+    return complex(p, p * q_over_p(power_factor))
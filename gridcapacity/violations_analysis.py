@@ -50,6 +50,10 @@ class PowerFlows:
     def increment_count(cls) -> None:
         cls._power_flows_count += 1
 
+    @classmethod
+    def add_count(cls, power_flows_count: int) -> None:
+        cls._power_flows_count += power_flows_count
+
     @classmethod
     def reset_count(cls) -> None:
         cls._power_flows_count = 0
@@ -108,6 +112,29 @@ class ViolationsStats:
     def is_empty(cls) -> bool:
         return len(cls._violations_stats.keys()) == 0
 
+    @classmethod
+    def pop(cls) -> ViolationTypeToLimitValue:
+        """Return the stats as plain dicts, that can be pickled, and reset them"""
+        violations_stats: ViolationTypeToLimitValue = {
+            violation: {
+                limit: dict(ss_violations)
+                for limit, ss_violations in limit_value_to_ss_violations.items()
+            }
+            for violation, limit_value_to_ss_violations in cls._violations_stats.items()
+        }
+        cls.reset()
+        return violations_stats
+
+    @classmethod
+    def merge(cls, violations_stats: ViolationTypeToLimitValue) -> None:
+        """Add the stats collected by another process"""
+        for violation, limit_value_to_ss_violations in violations_stats.items():
+            for limit, ss_violations in limit_value_to_ss_violations.items():
+                for ss_idx, violated_values in ss_violations.items():
+                    cls._violations_stats[violation][limit][ss_idx].extend(
+                        violated_values
+                    )
+
     @classmethod
     def append_violations(
         cls,
@@ -197,6 +224,21 @@ class ViolationsStats:
     def reset_base_case_violations(cls) -> None:
         cls._base_case_violations = {}
 
+    @classmethod
+    def base_case_violations_dict(cls) -> ViolationTypeToSubsystemIdx:
+        """Return the base case violations as plain dicts, that can be pickled"""
+        return {
+            violation: dict(ss_violations)
+            for violation, ss_violations in cls._base_case_violations.items()
+        }
+
+    @classmethod
+    def set_base_case_violations(
+        cls, base_case_violations: ViolationTypeToSubsystemIdx
+    ) -> None:
+        """Register the base case violations found by another process"""
+        cls._base_case_violations = base_case_violations
+
     @classmethod
     def base_case_violations_detected(cls) -> bool:
         return len(cls._base_case_violations.keys()) == 0
@@ -237,8 +279,9 @@ def check_violations(
     trafo_rate: str = "Rate1",
     use_full_newton_raphson: bool = False,
     solver_opts: Optional[dict] = None,
+    warm_start: bool = False,
 ) -> Violations:
-    run_solver(use_full_newton_raphson, solver_opts)
+    run_solver(use_full_newton_raphson, solver_opts, warm_start)
     v: Violations = Violations.NO_VIOLATIONS
     if not wf.is_converged():
         v |= Violations.NOT_CONVERGED
@@ -306,6 +349,8 @@ def check_violations(
 def run_solver(
     use_full_newton_raphson: bool,
     solver_opts: Optional[dict] = None,
+    warm_start: bool = False,
 ) -> None:
-    wf.run_solver(use_full_newton_raphson, solver_opts)
+    """Run the power flow, starting from the previous solution if `warm_start`"""
+    wf.run_solver(use_full_newton_raphson, solver_opts, warm_start)
     PowerFlows.increment_count()
@@ -13,8 +13,10 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import multiprocessing
 import sys
 import unittest
+from typing import Any, Optional
 
 from gridcapacity.backends.subsystems import Bus
 from gridcapacity.backends.subsystems.branch import Branch
@@ -27,13 +29,136 @@ from gridcapacity.capacity_analysis import (
 )
 from gridcapacity.contingency_analysis import ContingencyScenario, LimitingFactor
 from gridcapacity.envs import envs
-from gridcapacity.violations_analysis import Violations, ViolationsLimits
+from gridcapacity.violations_analysis import (
+    PowerFlows,
+    Violations,
+    ViolationsLimits,
+    ViolationsStats,
+)
 from tests import DEFAULT_CASE
 
 if sys.platform == "win32" and not envs.pandapower_backend:
     from gridcapacity.backends.psse import init_psse
 
 
+@unittest.skipIf(
+    sys.platform == "win32" and not envs.pandapower_backend,
+    "The buses and contingencies are numbered as in the PandaPower case",
+)
+class TestBusesHeadroomParallel(unittest.TestCase):
+    def setUp(self) -> None:
+        self.start_method: Optional[str] = multiprocessing.get_start_method(
+            allow_none=True
+        )
+
+    def tearDown(self) -> None:
+        multiprocessing.set_start_method(self.start_method, force=True)
+
+    def assert_parallel_headroom_equal(self, **kwargs: Any) -> tuple[Headroom, Any]:
+        """Assert the parallel analysis results are the same as the serial ones
+
+        The workers are started by forking and spawning processes.
+        Return the serial headroom and analysis stats.
+        """
+        # Every analysis registers the base case violations from scratch
+        ViolationsStats.reset_base_case_violations()
+        serial_headroom = list(buses_headroom(**kwargs))
+        serial_violations_stats = ViolationsStats.pop()
+        serial_stats = CapacityAnalysisStats.pop()
+        for start_method in ("fork", "spawn"):
+            if start_method not in multiprocessing.get_all_start_methods():
+                continue
+            with self.subTest(start_method=start_method):
+                multiprocessing.set_start_method(start_method, force=True)
+                ViolationsStats.reset_base_case_violations()
+                self.assertEqual(
+                    serial_headroom, list(buses_headroom(**kwargs, n_processes=2))
+                )
+                self.assertEqual(serial_violations_stats, ViolationsStats.pop())
+                self.assertEqual(serial_stats, CapacityAnalysisStats.pop())
+        return serial_headroom, serial_stats
+
+    def test_parallel_buses_headroom(self) -> None:
+        # The normal limits are wide, so the contingencies limit the headroom
+        _, (_, contingency_stats) = self.assert_parallel_headroom_equal(
+            case_name=DEFAULT_CASE,
+            upper_load_limit_p_mw=400.0,
+            upper_gen_limit_p_mw=400.0,
+            selected_buses_ids=(152, 153, 201, 203, 205),
+            normal_limits=ViolationsLimits(
+                max_bus_voltage_pu=1.2,
+                min_bus_voltage_pu=0.8,
+                max_branch_loading_pct=200.0,
+                max_trafo_loading_pct=200.0,
+                max_swing_bus_power_p_mw=5000.0,
+                branch_rate="Rate1",
+                trafo_rate="Rate1",
+            ),
+            contingency_scenario=ContingencyScenario(
+                branches=tuple(
+                    Branch(*args) for args in ((2, 6), (3, 7), (3, 16), (5, 20))
+                ),
+                trafos=(Trafo(13, 14), Trafo(16, 17)),
+            ),
+            verbose=False,
+        )
+        self.assertTrue(contingency_stats)
+
+    def test_parallel_buses_headroom_with_base_case_violations(self) -> None:
+        # The base case violates the normal limits, the workers must exclude them
+        headroom, _ = self.assert_parallel_headroom_equal(
+            case_name=DEFAULT_CASE,
+            upper_load_limit_p_mw=400.0,
+            upper_gen_limit_p_mw=400.0,
+            selected_buses_ids=(152, 153, 201, 203, 205),
+            normal_limits=ViolationsLimits(
+                max_bus_voltage_pu=1.04,
+                min_bus_voltage_pu=0.95,
+                max_branch_loading_pct=100.0,
+                max_trafo_loading_pct=100.0,
+                max_swing_bus_power_p_mw=5000.0,
+                branch_rate="Rate1",
+                trafo_rate="Rate1",
+            ),
+            contingency_scenario=ContingencyScenario(branches=(), trafos=()),
+            verbose=False,
+        )
+        self.assertEqual(
+            [9.375, 3.125, 12.5, 3.125, 18.75],
+            [bus_headroom.load_avail_mva.real for bus_headroom in headroom],
+        )
+
+
+@unittest.skipIf(
+    sys.platform == "win32" and not envs.pandapower_backend,
+    "The bus is numbered as in the PandaPower case",
+)
+class TestBusesHeadroomRelTolerance(unittest.TestCase):
+    def test_headroom_rel_tolerance(self) -> None:
+        load_avail_p_mw: dict[float, float] = {}
+        power_flows_count: dict[float, int] = {}
+        for headroom_rel_tolerance in (0.0, 0.1):
+            # Every analysis registers the base case violations from scratch
+            ViolationsStats.reset_base_case_violations()
+            headroom = buses_headroom(
+                case_name=DEFAULT_CASE,
+                upper_load_limit_p_mw=400.0,
+                upper_gen_limit_p_mw=0.0,
+                selected_buses_ids=(3005,),
+                headroom_tolerance_p_mw=0.5,
+                max_iterations=20,
+                verbose=False,
+                headroom_rel_tolerance=headroom_rel_tolerance,
+            )
+            load_avail_p_mw[headroom_rel_tolerance] = headroom[0].load_avail_mva.real
+            power_flows_count[headroom_rel_tolerance] = PowerFlows.count
+        self.assertLess(power_flows_count[0.1], power_flows_count[0.0])
+        # The headroom found with the absolute tolerance is at most 0.5 MW lower
+        # than the actual one, which is within 10 % above the relative one
+        self.assertLessEqual(load_avail_p_mw[0.1], load_avail_p_mw[0.0] + 0.5)
+        self.assertGreater(load_avail_p_mw[0.1], 0.9 * load_avail_p_mw[0.0])
+
+
 class TestCapacityAnalysis(unittest.TestCase):
     headroom: Headroom
 
@@ -41,6 +166,7 @@ class TestCapacityAnalysis(unittest.TestCase):
     def setUpClass(cls) -> None:
         if sys.platform == "win32" and not envs.pandapower_backend:
             init_psse()
+        ViolationsStats.reset_base_case_violations()
         branch_args = (
             (
                 (151, 201),
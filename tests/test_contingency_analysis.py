@@ -13,13 +13,16 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import multiprocessing
 import sys
 import unittest
+from typing import Optional
 
 from gridcapacity import ViolationsStats
 from gridcapacity.backends import wrapped_funcs as wf
 from gridcapacity.backends.subsystems.branch import Branch
 from gridcapacity.backends.subsystems.trafo import Trafo
+from gridcapacity.capacity_analysis import CapacityAnalyser
 from gridcapacity.contingency_analysis import (
     ContingencyScenario,
     LimitingFactor,
@@ -142,3 +145,60 @@ class TestContingencyAnalysis(unittest.TestCase):
                 ),
                 get_contingency_scenario(False, {"options1": 1, "options5": 1}),
             )
+
+
+@unittest.skipIf(
+    sys.platform == "win32" and not envs.pandapower_backend,
+    "The spawned workers need the PandaPower backend",
+)
+class TestParallelContingencyScenario(unittest.TestCase):
+    def setUp(self) -> None:
+        self.start_method: Optional[str] = multiprocessing.get_start_method(
+            allow_none=True
+        )
+        ViolationsStats.reset_base_case_violations()
+
+    def tearDown(self) -> None:
+        multiprocessing.set_start_method(self.start_method, force=True)
+        ViolationsStats.reset_base_case_violations()
+
+    def test_get_contingency_scenario_with_base_case_violations(self) -> None:
+        # The base case violates the normal limits, the workers must exclude them
+        capacity_analyser = CapacityAnalyser(
+            case_name=DEFAULT_CASE,
+            upper_load_limit_p_mw=100.0,
+            upper_gen_limit_p_mw=100.0,
+            load_power_factor=0.9,
+            gen_power_factor=0.9,
+            selected_buses_ids=None,
+            headroom_tolerance_p_mw=5.0,
+            solver_opts=None,
+            max_iterations=10,
+            normal_limits=ViolationsLimits(
+                max_bus_voltage_pu=1.04,
+                min_bus_voltage_pu=0.95,
+                max_branch_loading_pct=100.0,
+                max_trafo_loading_pct=100.0,
+                max_swing_bus_power_p_mw=5000.0,
+                branch_rate="Rate1",
+                trafo_rate="Rate1",
+            ),
+            contingency_limits=ViolationsLimits(
+                max_bus_voltage_pu=1.1,
+                min_bus_voltage_pu=0.9,
+                max_branch_loading_pct=120.0,
+                max_trafo_loading_pct=120.0,
+                max_swing_bus_power_p_mw=5000.0,
+                branch_rate="Rate1",
+                trafo_rate="Rate1",
+            ),
+            contingency_scenario=ContingencyScenario(branches=(), trafos=()),
+        )
+        serial_scenario = capacity_analyser.handle_empty_contingency_scenario(None)
+        self.assertEqual(21, len(serial_scenario.branches))
+        self.assertEqual(7, len(serial_scenario.trafos))
+        multiprocessing.set_start_method("spawn", force=True)
+        self.assertEqual(
+            serial_scenario,
+            capacity_analyser.handle_empty_contingency_scenario(None, n_processes=2),
+        )
@@ -0,0 +1,83 @@
+"""
+Copyright 2023 Vattenfall AB
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+
+from gridcapacity.backends.subsystems import Bus
+from gridcapacity.backends.subsystems.branch import Branch
+from gridcapacity.capacity_analysis import BusHeadroom, Headroom
+from gridcapacity.contingency_analysis import LimitingFactor
+from gridcapacity.violations_analysis import Violations
+
+BUSES_HEADROOM = tuple(
+    BusHeadroom(
+        bus=Bus(number=number, ex_name=f"BUS {number}", type=1),
+        actual_load_mva=complex(number, 1),
+        actual_gen_mva=complex(0, number),
+        load_avail_mva=complex(100 - number, 2),
+        gen_avail_mva=0j,
+        load_lf=LimitingFactor(Violations.BRANCH_LOADING, ss=Branch(5, 10))
+        if number % 2
+        else None,
+        gen_lf=None,
+    )
+    for number in range(1, 6)
+)
+
+
+class TestHeadroom(unittest.TestCase):
+    def setUp(self) -> None:
+        # Grown past the expected size twice
+        self.headroom = Headroom(2)
+        for bus_headroom in BUSES_HEADROOM:
+            self.headroom.append(bus_headroom)
+
+    def test_append_past_expected_size(self) -> None:
+        self.assertEqual(5, len(self.headroom))
+        self.assertEqual(list(BUSES_HEADROOM), list(self.headroom))
+
+    def test_append_without_expected_size(self) -> None:
+        headroom = Headroom()
+        for bus_headroom in BUSES_HEADROOM:
+            headroom.append(bus_headroom)
+        self.assertEqual(list(BUSES_HEADROOM), list(headroom))
+
+    def test_negative_index(self) -> None:
+        self.assertEqual(BUSES_HEADROOM[-1], self.headroom[-1])
+        self.assertEqual(BUSES_HEADROOM[0], self.headroom[-5])
+        for idx in (5, -6):
+            with self.subTest(idx=idx), self.assertRaises(IndexError):
+                self.headroom[idx]
+
+    def test_slices(self) -> None:
+        for idx in (slice(1, 3), slice(None, None, -2), slice(3, 10), slice(4, 1)):
+            with self.subTest(idx=idx):
+                self.assertEqual(BUSES_HEADROOM[idx], self.headroom[idx])
+
+    def test_columns(self) -> None:
+        self.assertEqual(
+            [bus_headroom.bus for bus_headroom in BUSES_HEADROOM], self.headroom.buses
+        )
+        for column in (
+            "actual_load_mva",
+            "actual_gen_mva",
+            "load_avail_mva",
+            "gen_avail_mva",
+        ):
+            with self.subTest(column=column):
+                self.assertEqual(
+                    [getattr(bus_headroom, column) for bus_headroom in BUSES_HEADROOM],
+                    getattr(self.headroom, column).tolist(),
+                )
@@ -0,0 +1,69 @@
+"""
+Copyright 2023 Vattenfall AB
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from gridcapacity.backends.subsystems.branch import Branch
+from gridcapacity.contingency_analysis import LimitingFactor
+from gridcapacity.output import (
+    dumps_json,
+    json_dump_kwargs,
+    orjson,
+    write_json_records,
+)
+from gridcapacity.violations_analysis import Violations
+
+RECORDS = (
+    {
+        "bus": 5,
+        "load_avail_mva": 1.5 - 0.25j,
+        "load_lf": LimitingFactor(
+            Violations.BRANCH_LOADING | Violations.BUS_UNDERVOLTAGE,
+            ss=Branch(5, 10),
+        ),
+        "gen_lf": None,
+        "stats": {105.0: {3: [102.952880859375, 107.74284564774533]}, 0.9: {}},
+    },
+    {"bus": "1", "conditions": [], "in_service": True},
+)
+
+
+class TestOutput(unittest.TestCase):
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_dumps_json_as_json(self) -> None:
+        for record in RECORDS:
+            self.assertEqual(json.dumps(record, **json_dump_kwargs), dumps_json(record))
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_dumps_json_same_values_as_json(self) -> None:
+        """`orjson` doesn't escape non-ASCII and writes exponents as `1e16`"""
+        obj = {"values": [1e-05, 1e16, 2.5e-300], "name": "Forsmark Väst"}
+        self.assertEqual(
+            json.loads(json.dumps(obj, **json_dump_kwargs)),
+            json.loads(dumps_json(obj)),
+        )
+
+    def test_write_json_records(self) -> None:
+        for records in (RECORDS, ()):
+            with tempfile.TemporaryDirectory() as output_folder:
+                output: Path = Path(output_folder) / "records.json"
+                write_json_records("records", iter(records), output)
+                self.assertEqual(
+                    json.dumps({"records": list(records)}, **json_dump_kwargs),
+                    output.read_text(encoding="utf-8"),
+                )
@@ -0,0 +1,67 @@
+"""
+Copyright 2023 Vattenfall AB
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import sys
+import unittest
+
+from gridcapacity.backends import wrapped_funcs as wf
+from gridcapacity.backends.subsystems import (
+    Bus,
+    Buses,
+    TemporaryBusLoad,
+    TemporaryBusMachine,
+)
+from gridcapacity.envs import envs
+from tests import DEFAULT_CASE
+
+if sys.platform != "win32" or envs.pandapower_backend:
+    from gridcapacity.backends import pandapower as pp_backend
+
+
+def temp_rows(table_name: str) -> list[tuple[int, float, float]]:
+    """Return the bus, real and reactive power of the temporary subsystems"""
+    # The network is replaced by every case reload
+    table = getattr(pp_backend.net, table_name)
+    return list(
+        table.loc[table.name == "Tm", ["bus", "p_mw", "q_mvar"]].itertuples(
+            index=False, name=None
+        )
+    )
+
+
+@unittest.skipIf(
+    sys.platform == "win32" and not envs.pandapower_backend,
+    "The temporary subsystems are looked up in the PandaPower network",
+)
+class TestTemporaryBusSubsystems(unittest.TestCase):
+    def setUp(self) -> None:
+        wf.open_case(DEFAULT_CASE)
+
+    def test_set_power_after_reload(self) -> None:
+        bus: Bus = Buses()[3]
+        for temp_subsystem, table_name in (
+            (TemporaryBusLoad(bus), "load"),
+            (TemporaryBusMachine(bus), "sgen"),
+        ):
+            with self.subTest(table_name=table_name):
+                with temp_subsystem(10 + 5j):
+                    temp_subsystem.set_power(20 + 10j)
+                    self.assertEqual([(bus.pp_idx, 20.0, 10.0)], temp_rows(table_name))
+                    wf.open_case(DEFAULT_CASE)
+                    temp_subsystem.mark_purged()
+                    self.assertEqual([], temp_rows(table_name))
+                    temp_subsystem.set_power(30 + 15j)
+                    self.assertEqual([(bus.pp_idx, 30.0, 15.0)], temp_rows(table_name))
+                self.assertEqual([], temp_rows(table_name))